@@ -0,0 +1,25 @@
+-- Migration for existing databases: fill physical object administrative unit and municipality by its center.
+-- Can be executed multiple times.
+
+BEGIN TRANSACTION;
+
+CREATE OR REPLACE FUNCTION trigger_set_physical_object_location() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.administrative_unit_id IS NULL OR TG_OP = 'UPDATE' AND NEW.center IS DISTINCT FROM OLD.center THEN
+        NEW.administrative_unit_id = (SELECT id FROM administrative_units WHERE ST_CoveredBy(NEW.center, geometry) ORDER BY population DESC LIMIT 1);
+    END IF;
+    IF TG_OP = 'INSERT' AND NEW.municipality_id IS NULL OR TG_OP = 'UPDATE' AND NEW.center IS DISTINCT FROM OLD.center THEN
+        NEW.municipality_id = (SELECT id FROM municipalities WHERE ST_CoveredBy(NEW.center, geometry) ORDER BY population DESC LIMIT 1);
+    END IF;
+    RETURN NEW;
+END;
+$$;
+ALTER FUNCTION trigger_set_physical_object_location() OWNER TO postgres;
+
+DROP TRIGGER IF EXISTS set_physical_object_location ON physical_objects;
+CREATE TRIGGER set_physical_object_location BEFORE INSERT OR UPDATE OF geometry, center ON physical_objects
+    FOR EACH ROW EXECUTE PROCEDURE trigger_set_physical_object_location();
+
+END TRANSACTION;
@@ -1,13 +1,28 @@
 """
 IDU Digital City Platform management tool, GUI and CLI versions
 """
-from platform_management.cli import (
-    add_buildings,
-    add_services,
-    insert_buildings_cli,
-    insert_services_cli,
-    load_objects,
-)
-
-from .dto import BuildingInsertionMapping, ServiceInsertionMapping
+from importlib import import_module
+from typing import Any
+
 from .version import VERSION as __version__
+
+_LAZY_ATTRIBUTES = {
+    "add_buildings": "platform_management.cli",
+    "add_services": "platform_management.cli",
+    "insert_buildings_cli": "platform_management.cli",
+    "insert_services_cli": "platform_management.cli",
+    "load_objects": "platform_management.cli",
+    "BuildingInsertionMapping": "platform_management.dto",
+    "ServiceInsertionMapping": "platform_management.dto",
+}
+"""Public names imported on the first access, so that CLI startup does not load pandas and database modules."""
+
+__all__ = list(_LAZY_ATTRIBUTES) + ["__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
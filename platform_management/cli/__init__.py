@@ -1,11 +1,33 @@
 """
 Command-line interface logic is defined here.
 """
-from .adm_division import AdmDivisionType, add_adm_division
-from .blocks import add_blocks
-from .buildings import add_buildings
-from .common import SingleObjectStatus
-from .files import load_objects
-from .operations import refresh_materialized_views, update_buildings_area, update_physical_objects_locations
-from .run_cli import insert_adms_cli, insert_blocks_cli, insert_buildings_cli, insert_services_cli
-from .services import add_services
+from importlib import import_module
+from typing import Any
+
+_LAZY_ATTRIBUTES = {
+    "AdmDivisionType": ".common",
+    "add_adm_division": ".adm_division",
+    "add_blocks": ".blocks",
+    "add_buildings": ".buildings",
+    "SingleObjectStatus": ".common",
+    "load_objects": ".files",
+    "refresh_materialized_views": ".operations",
+    "update_buildings_area": ".operations",
+    "update_physical_objects_locations": ".operations",
+    "insert_adms_cli": ".run_cli",
+    "insert_blocks_cli": ".run_cli",
+    "insert_buildings_cli": ".run_cli",
+    "insert_services_cli": ".run_cli",
+    "add_services": ".services",
+}
+"""Public names imported from the submodules on the first access, as most of them depend on pandas."""
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
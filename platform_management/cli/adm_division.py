@@ -7,7 +7,7 @@ import os
 import time
 import traceback
 import warnings
-from enum import Enum
+import weakref
 from functools import reduce
 from typing import Callable
 
@@ -17,17 +17,13 @@ from loguru import logger
 from numpy import nan
 from tqdm import tqdm
 
-from platform_management.cli.common import SingleObjectStatus
+from platform_management.cli.common import AdmDivisionType, SingleObjectStatus
 from platform_management.dto import AdmDivisionInsertionMapping
 
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 
-
-class AdmDivisionType(Enum):
-    """Administrative division unit type."""
-
-    ADMINISTRATIVE_UNIT = "ADMINISTRATIVE_UNIT"
-    MUNICIPALITY = "MUNICIPALITY"
+_administrative_unit_insert_prepared: weakref.WeakSet[psycopg2.extensions.connection] = weakref.WeakSet()
+_municipality_insert_prepared: weakref.WeakSet[psycopg2.extensions.connection] = weakref.WeakSet()
 
 
 def insert_administrative_unit(
@@ -43,21 +39,27 @@ def insert_administrative_unit(
     Returns an identifier of the added administrative_units.
     """
     assert row[mapping.type_name] in administrative_unit_types, "Given adm division type is not in the database"
+    if cur.connection not in _administrative_unit_insert_prepared:
+        cur.execute(
+            "PREPARE insert_administrative_unit(text, varchar, integer, integer, varchar, integer, varchar) AS"
+            " WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON($1), 4326) geometry),"
+            " center_t AS (SELECT ST_Centroid(geometry) center FROM geometry_t)"
+            " INSERT INTO administrative_units (parent_id, city_id, type_id, name, geometry,"
+            "   center, population, municipality_parent_id)"
+            " VALUES ("
+            "   (SELECT id FROM administrative_units WHERE name = $2),"
+            "   $3,"
+            "   $4,"
+            "   $5,"
+            "   (SELECT geometry FROM geometry_t),"
+            "   (SELECT center FROM center_t),"
+            "   $6,"
+            "   (SELECT id FROM municipalities WHERE city_id = $3 AND name = $7)"
+            ") RETURNING id"
+        )
+        _administrative_unit_insert_prepared.add(cur.connection)
     cur.execute(
-        "WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326) geometry),"
-        " center_t AS (SELECT ST_Centroid(geometry) center FROM geometry_t)"
-        " INSERT INTO administrative_units (parent_id, city_id, type_id, name, geometry,"
-        "   center, population, municipality_parent_id)"
-        " VALUES ("
-        "   (SELECT id FROM administrative_units WHERE name = %s),"
-        "   %s,"
-        "   %s,"
-        "   %s,"
-        "   (SELECT geometry FROM geometry_t),"
-        "   (SELECT center FROM center_t),"
-        "   %s,"
-        "   (SELECT id FROM municipalities WHERE city_id = %s AND name = %s)"
-        ") RETURNING id",
+        "EXECUTE insert_administrative_unit(%s, %s, %s, %s, %s, %s, %s)",
         (
             row[mapping.geometry],
             row.get(mapping.parent_same_type),
@@ -65,7 +67,6 @@ def insert_administrative_unit(
             administrative_unit_types[row[mapping.type_name].lower()],
             row[mapping.name],
             row.get(mapping.population),
-            city_id,
             row.get(mapping.parent_other_type),
         ),
     )
@@ -89,21 +90,27 @@ def insert_municipality(
     Returns an identifier of the added municipality.
     """
     assert row[mapping.type_name] in municipalities_types, "Given adm division type is not in the database"
+    if cur.connection not in _municipality_insert_prepared:
+        cur.execute(
+            "PREPARE insert_municipality(text, varchar, integer, integer, varchar, integer, varchar) AS"
+            " WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON($1), 4326) geometry),"
+            " center_t AS (SELECT ST_Centroid(geometry) center FROM geometry_t)"
+            " INSERT INTO municipalities (parent_id, city_id, type_id, name, geometry,"
+            "   center, population, admin_unit_parent_id)"
+            " VALUES ("
+            "   (SELECT id FROM municipalities WHERE name = $2),"
+            "   $3,"
+            "   $4,"
+            "   $5,"
+            "   (SELECT geometry FROM geometry_t),"
+            "   (SELECT center FROM center_t),"
+            "   $6,"
+            "   (SELECT id FROM administrative_units WHERE city_id = $3 AND name = $7)"
+            ") RETURNING id"
+        )
+        _municipality_insert_prepared.add(cur.connection)
     cur.execute(
-        "WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326) geometry),"
-        " center_t AS (SELECT ST_Centroid(geometry) center FROM geometry_t)"
-        " INSERT INTO municipalities (parent_id, city_id, type_id, name, geometry,"
-        "   center, population, admin_unit_parent_id)"
-        " VALUES ("
-        "   (SELECT id FROM municipalities WHERE name = %s),"
-        "   %s,"
-        "   %s,"
-        "   %s,"
-        "   (SELECT geometry FROM geometry_t),"
-        "   (SELECT center FROM center_t),"
-        "   %s,"
-        "   (SELECT id FROM administrative_units WHERE city_id = %s AND name = %s)"
-        ") RETURNING id",
+        "EXECUTE insert_municipality(%s, %s, %s, %s, %s, %s, %s)",
         (
             row[mapping.geometry],
             row.get(mapping.parent_same_type),
@@ -111,7 +118,6 @@ def insert_municipality(
             municipalities_types[row[mapping.type_name]],
             row[mapping.name],
             row.get(mapping.population),
-            city_id,
             row.get(mapping.parent_other_type),
         ),
     )
@@ -172,8 +178,8 @@ def update_administrative_unit(
 
     if geom_str != data[3]:
         db_fields.extend(["geometry", "center"])
-        preparations.extend(["%(geometry)s", "(SELECT ST_Centroid(%(geometry)s))"])
-        values.append({"geometry": row[mapping.geometry]})
+        preparations.extend(["%(geometry)s::geometry", "ST_Centroid(%(geometry)s::geometry)"])
+        values.append({"geometry": geom_str})
 
     if row.get(mapping.population) is not None and row[mapping.population] != data[4]:
         db_fields.append("population")
@@ -249,8 +255,8 @@ def update_municipality(
 
     if geom_str != data[3]:
         db_fields.extend(["geometry", "center"])
-        preparations.extend(["%(geometry)", "(SELECT ST_Centroid(%(geometry)s)"])
-        values.append({"geometry": row[mapping.name]})
+        preparations.extend(["%(geometry)s::geometry", "ST_Centroid(%(geometry)s::geometry)"])
+        values.append({"geometry": geom_str})
 
     if row.get(mapping.population) is not None and row[mapping.population] != data[4]:
         db_fields.append("population")
@@ -395,18 +401,18 @@ def add_adm_division(  # pylint: disable=too-many-branches,too-many-statements
                         skipped += 1
                         continue
 
-                    cur.execute("SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)", (row[mapping.geometry],))
-                    geom_str = cur.fetchone()[0]
                     cur.execute(
-                        "SELECT id FROM "
+                        "WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%(geometry)s), 4326) geometry)"
+                        " SELECT adm.id FROM "
                         + (
                             "administrative_units"
                             if division_type == AdmDivisionType.ADMINISTRATIVE_UNIT
                             else "municipalities"
                         )
-                        + " WHERE city_id = %(city_id)s"
-                        "   AND (ST_Overlaps(geometry, %(geom)s) OR ST_Equals(geometry, %(geom)s))",
-                        {"city_id": city_id, "geom": geom_str},
+                        + " adm, geometry_t g"
+                        " WHERE adm.city_id = %(city_id)s"
+                        "   AND (ST_Overlaps(adm.geometry, g.geometry) OR ST_Equals(adm.geometry, g.geometry))",
+                        {"city_id": city_id, "geometry": row[mapping.geometry]},
                     )
 
                     if cur.rowcount > 2:
@@ -168,25 +168,29 @@ def add_blocks(  # pylint: disable=too-many-branches,too-many-statements
                         skipped += 1
                         continue
 
-                    cur.execute("SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)", (row[geometry_column],))
-                    geom_str = cur.fetchone()[0]
                     cur.execute(
-                        "SELECT id, geometry FROM blocks"
-                        " WHERE city_id = %(city_id)s"
-                        "   AND ("
-                        "       ST_Contains(geometry, %(geom)s)"
-                        "       OR ST_Contains(%(geom)s, geometry)"
-                        "       OR ST_Overlaps(geometry, %(geom)s)"
-                        "       OR ST_Equals(geometry, %(geom)s)"
-                        "   )",
-                        {"city_id": city_id, "geom": geom_str},
+                        "WITH geometry_t AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%(geometry)s), 4326) geometry)"
+                        " SELECT g.geometry, b.id, b.geometry FROM geometry_t g"
+                        "   LEFT JOIN blocks b ON b.city_id = %(city_id)s"
+                        "       AND ("
+                        "           ST_Contains(b.geometry, g.geometry)"
+                        "           OR ST_Contains(g.geometry, b.geometry)"
+                        "           OR ST_Overlaps(b.geometry, g.geometry)"
+                        "           OR ST_Equals(b.geometry, g.geometry)"
+                        "       )",
+                        {"city_id": city_id, "geometry": row[geometry_column]},
                     )
+                    found = cur.fetchall()
+                    geom_str = found[0][0]
+                    intersecting_blocks = [
+                        (block_id, block_geometry) for _, block_id, block_geometry in found if block_id is not None
+                    ]
 
-                    if cur.rowcount > 2:
+                    if len(intersecting_blocks) > 2:
                         block_ids[i] = -1
                         results[i] = "Пропущен. Пересекается более чем с одним другим кварталом"
                         skipped += 1
-                    elif cur.rowcount == 0:
+                    elif len(intersecting_blocks) == 0:
                         block_ids[i] = insert_block(
                             cur,
                             geom_str,
@@ -196,7 +200,7 @@ def add_blocks(  # pylint: disable=too-many-branches,too-many-statements
                         results[i] = f"Добавлен с id={block_ids[i]}"
                         added += 1
                     else:
-                        block_id, block_geometry = cur.fetchone()
+                        block_id, block_geometry = intersecting_blocks[0]
                         block_ids[i] = block_id
                         if block_geometry == geom_str:
                             results[i] = f"Оставлен без изменений, совпадает с кварталом в БД: id={block_id}"
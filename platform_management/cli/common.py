@@ -11,6 +11,13 @@ from typing import Any
 from loguru import logger
 
 
+class AdmDivisionType(Enum):
+    """Administrative division unit type."""
+
+    ADMINISTRATIVE_UNIT = "ADMINISTRATIVE_UNIT"
+    MUNICIPALITY = "MUNICIPALITY"
+
+
 class SQLType(Enum):
     """
     Class to map SQL types to Python types
@@ -9,16 +9,34 @@ from loguru import logger
 def refresh_materialized_views(
     cur: psycopg2.extensions.cursor, materialized_views_names: list[str] | None = ...
 ) -> None:
-    """Refresh given materialized views (default all_buildings, all_services, houses and all_houses)."""
+    """Refresh given materialized views (default all_buildings, all_services, houses and all_houses).
+
+    Populated views having a unique index on plain columns without a WHERE clause are refreshed CONCURRENTLY,
+    so they stay readable during the refresh.
+    """
 
     if materialized_views_names is None:
         return
     if materialized_views_names is ...:
         materialized_views_names = ["all_buildings", "all_services", "houses", "all_houses"]
 
+    cur.execute(
+        "SELECT DISTINCT names.name FROM unnest(%s::text[]) names(name)"
+        "   JOIN pg_class c ON c.oid = to_regclass(names.name)"
+        "   JOIN pg_index i ON i.indrelid = c.oid"
+        " WHERE c.relkind = 'm' AND c.relispopulated"
+        "   AND i.indisunique AND i.indpred IS NULL AND 0 <> ALL(i.indkey::int2[])",
+        (list(materialized_views_names),),
+    )
+    concurrent_names = {name for (name,) in cur}
+
     for name in materialized_views_names:
-        logger.info("Refreshing materialized view '{}'", name)
-        cur.execute(f"REFRESH MATERIALIZED VIEW {name}")
+        if name in concurrent_names:
+            logger.info("Refreshing materialized view '{}' concurrently", name)
+            cur.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}")
+        else:
+            logger.info("Refreshing materialized view '{}'", name)
+            cur.execute(f"REFRESH MATERIALIZED VIEW {name}")
 
 
 def update_physical_objects_locations(cur: psycopg2.extensions.cursor, city_id: int | None = None) -> None:
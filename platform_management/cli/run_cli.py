@@ -32,6 +32,18 @@ LOG_HANDLER_ID = logger.add(
 )
 
 
+def _split_properties_mapping(properties_mapping: list[str]) -> dict[str, str]:
+    """Split "key_in_properties:column_in_document" entries once, exit if any of them is missing a ":"."""
+    properties_mapping_dict: dict[str, str] = {}
+    for entry in properties_mapping:
+        key, sep, column = entry.partition(":")
+        if not sep:
+            logger.error('Properties mapping "{}" does not set a mapping (missing ":"). Exiting', entry)
+            sys.exit(1)
+        properties_mapping_dict[key] = column
+    return properties_mapping_dict
+
+
 def _common(
     dry_run: bool,
     verbose: bool,
@@ -125,12 +137,7 @@ def insert_services_cli(  # pylint: disable=too-many-arguments,too-many-locals
     else:
         address_prefixes.sort(key=len, reverse=True)
 
-    for entry in properties_mapping:
-        if ":" not in entry:
-            logger.error('Properties mapping "{}" does not set a mapping (missing ":"). Exiting', entry)
-            sys.exit(1)
-
-    properties_mapping_dict = {entry[: entry.find(":")]: entry[entry.find(":") + 1 :] for entry in properties_mapping}
+    properties_mapping_dict = _split_properties_mapping(properties_mapping)
 
     logger.info("Соответствие (маппинг) документа: {}", columns_mapping)
 
@@ -179,12 +186,7 @@ def insert_buildings_cli(  # pylint: disable=too-many-arguments,too-many-locals
     else:
         address_prefixes.sort(key=len, reverse=True)
 
-    for entry in properties_mapping:
-        if ":" not in entry:
-            logger.error('Properties mapping "{}" does not set a mapping (missing ":"). Exiting', entry)
-            sys.exit(1)
-
-    properties_mapping_dict = {entry[: entry.find(":")]: entry[entry.find(":") + 1 :] for entry in properties_mapping}
+    properties_mapping_dict = _split_properties_mapping(properties_mapping)
 
     logfile, conn = _common(dry_run, verbose, log_filename, database_credentials, filename)
 
@@ -560,12 +560,13 @@ def add_services(  # pylint: disable=too-many-branches,too-many-statements,too-m
                                     )
                                 if current_geom_type == "ST_Point" and geom_type != "ST_Point":
                                     cur.execute(
-                                        "WITH tmp AS (SELECT geometry FROM"
-                                        "       (VALUES (ST_Centroid(ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)))"
-                                        "   ) tmp_inner(geometry))"
-                                        " UPDATE physical_objects"
-                                        " SET geometry = (SELECT geometry FORM tmp),"
-                                        "   center = ST_Centroid((SELECT geometry FROM tmp))"
+                                        "WITH new_geometry AS"
+                                        "   (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326) geometry)"
+                                        " UPDATE physical_objects p"
+                                        " SET geometry = g.geometry, center = ST_Centroid(g.geometry)"
+                                        " FROM new_geometry g"
+                                        " WHERE p.id = %s",
+                                        (row[mapping.geometry], phys_id),
                                     )
                                     results[i] += ". Обновлена геометрия здания с точки"
                             else:  # if no building found by address or geometry
@@ -641,11 +642,12 @@ def add_services(  # pylint: disable=too-many-branches,too-many-statements,too-m
                             )
                             if current_geom_type == "Point" and geom_type != "Point":
                                 cur.execute(
-                                    "WITH tmp AS (SELECT geometry FROM (VALUES"
-                                    "   (ST_Centroid(ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)))) tmp_inner(geometry))"
-                                    " UPDATE physical_objects"
-                                    " SET geometry = (SELECT geometry FORM tmp),"
-                                    "   center = ST_Centroid((SELECT geometry FROM tmp))"
+                                    "WITH new_geometry AS (SELECT ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326) geometry)"
+                                    " UPDATE physical_objects p"
+                                    " SET geometry = g.geometry, center = ST_Centroid(g.geometry)"
+                                    " FROM new_geometry g"
+                                    " WHERE p.id = %s",
+                                    (row[mapping.geometry], phys_id),
                                 )
                                 results[i] += ". Обновлена геометрия физического объекта с точки"
                         else:
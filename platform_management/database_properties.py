@@ -2,7 +2,11 @@
 """
 Database connection wrapper class `Properties` is defined here.
 """
+from contextlib import contextmanager
+from typing import Iterator
+
 import psycopg2
+import psycopg2.pool
 from loguru import logger
 
 
@@ -11,6 +15,9 @@ class Properties:
     Database connection wrapper.
     """
 
+    POOLED_CONNECT_TIMEOUT = 1
+    """Connect timeout (seconds) of the additional pooled connections, they are used for quick checks from GUI."""
+
     def __init__(self, db_addr: str, db_port: int, db_name: str, db_user: str, db_pass: str, connect_timeout: int = 10):
         self.db_addr = db_addr
         self.db_port = db_port
@@ -20,6 +27,7 @@ class Properties:
         self.connect_timeout = connect_timeout
         self._conn = None
         self._connected = False
+        self._pool: psycopg2.pool.ThreadedConnectionPool | None = None
 
     def reopen(self, db_addr: str, db_port: int, db_name: str, db_user: str, db_pass: str):
         """
@@ -51,11 +59,14 @@ class Properties:
         """
         Connection string used for a database connection.
         """
+        return self._get_conn_string(self.connect_timeout)
+
+    def _get_conn_string(self, connect_timeout: int) -> str:
         return (
             f"host={self.db_addr} port={self.db_port} dbname={self.db_name}"
             f" user={self.db_user} password={self.db_pass}"
             f" application_name=insert_services"
-            f" connect_timeout={self.connect_timeout}"
+            f" connect_timeout={connect_timeout}"
         )
 
     @property
@@ -78,9 +89,29 @@ class Properties:
             raise
         return self._conn
 
+    @contextmanager
+    def pooled_conn(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Additional database connection taken from the pool, for the queries which must not affect the main
+        connection transaction. The connection is returned to the pool (with a rollback) on exit.
+
+        Pooled connections are opened with a short connect timeout, so an unreachable database does not freeze
+        the caller for long.
+        """
+        if self._pool is None or self._pool.closed:
+            self._pool = psycopg2.pool.ThreadedConnectionPool(
+                1, 4, self._get_conn_string(min(self.connect_timeout, Properties.POOLED_CONNECT_TIMEOUT))
+            )
+        pool = self._pool
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn)
+
     def close(self):
         """
-        Close database connection.
+        Close database connection and the pool of additional connections.
         """
         if self._conn is not None and not self._conn.closed:
             try:
@@ -88,6 +119,12 @@ class Properties:
             except Exception as exc:  # pylint: disable=broad-except
                 logger.warning("couldn't close database connection: {!r}", exc)
         self._conn = None
+        if self._pool is not None and not self._pool.closed:
+            try:
+                self._pool.closeall()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("couldn't close database connections pool: {!r}", exc)
+        self._pool = None
 
     @property
     def connected(self) -> bool:
@@ -51,7 +51,7 @@ class DatabaseCredentials:
         return params
 
 
-@dataclass
+@dataclass(frozen=True)
 class ServiceInsertionMapping:  # pylint: disable=too-many-instance-attributes
     """Class to store the mapping between input document service properties and database columns."""
 
@@ -70,12 +70,12 @@ class ServiceInsertionMapping:  # pylint: disable=too-many-instance-attributes
         for field in get_fields(self):
             value = getattr(self, field.name)
             if value in ("", "-"):
-                setattr(self, field.name, None)
+                object.__setattr__(self, field.name, None)
         if (self.latitude is None or self.longitude is None) and self.geometry is None:
             raise ValueError("At least one of (latitude+longitude) and (geometry) must be set")
 
 
-@dataclass
+@dataclass(frozen=True)
 class BuildingInsertionCLIParameters:  # pylint: disable=too-many-instance-attributes
     """Class to store user input with multiple mapping options available for each attribute.
 
@@ -108,12 +108,12 @@ class BuildingInsertionCLIParameters:  # pylint: disable=too-many-instance-attri
         for field in get_fields(self):
             values = getattr(self, field.name)
             if len(values) == 0:
-                setattr(self, field.name, None)
-            elif len(values) > 0 and all(value in ("", "-") for value in values):
-                setattr(self, field.name, [])
+                object.__setattr__(self, field.name, None)
+            elif all(value in ("", "-") for value in values):
+                object.__setattr__(self, field.name, [])
 
 
-@dataclass
+@dataclass(frozen=True)
 class BuildingInsertionMapping:  # pylint: disable=too-many-instance-attributes
     """Class to store the mapping between input document building properties and database columns."""
 
@@ -139,7 +139,7 @@ class BuildingInsertionMapping:  # pylint: disable=too-many-instance-attributes
     modeled: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class AdmDivisionInsertionMapping:  # pylint: disable=too-many-instance-attributes
     """Class to store the mapping between input document administrative division unit
     properties and database columns.
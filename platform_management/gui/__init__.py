@@ -1,10 +1,22 @@
 """GUI module is located here."""
+from importlib import import_module
+from typing import Any
 
-
-from .init_window import InitWindow
-from .run import run_gui
+_LAZY_ATTRIBUTES = {
+    "InitWindow": ".init_window",
+    "run_gui": ".run",
+}
+"""Public names imported on the first access, so that importing `gui.defaults` does not load PySide6."""
 
 __all__ = [
     "run_gui",
     "InitWindow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,22 @@
 """Common Qt widgets to use in GUI application."""
 from __future__ import annotations
 
+import csv
+import itertools
 import json
-from typing import Any, Callable, NamedTuple, Sequence
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Sequence
 
-import psycopg2  # pylint: disable=unused-import
+import openpyxl
+import pandas as pd
+import psycopg2
 from frozenlist import FrozenList
 from loguru import logger
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from platform_management.database_properties import Properties
+
 
 def check_geometry_correctness(
     geometry_geojson: str | None, conn: psycopg2.extensions.connection
@@ -36,6 +44,149 @@ def check_geometry_correctness(
         return None
 
 
+def check_geometry_correctness_pooled(
+    geometry_geojson: str | None, db_properties: Properties
+) -> tuple[float, float, str] | None:
+    """Check the correctness of the geometry on a pooled connection (see `check_geometry_correctness`).
+
+    Unavailable database is reported as incorrect geometry, so the caller keeps the user input.
+    """
+    try:
+        with db_properties.pooled_conn() as conn:
+            return check_geometry_correctness(geometry_geojson, conn)
+    except psycopg2.OperationalError as exc:
+        logger.warning("Could not get a pooled connection to check the geometry: {!r}", exc)
+        return None
+
+
+def is_geometry_changed(geometry_geojson: str, new_geometry_geojson: str | None) -> bool:
+    """Check if the GeoJSON geometry was changed. Texts are compared first, so geometries are parsed only if
+    the text was edited. Incorrect new geometry is considered changed.
+    """
+    if geometry_geojson == new_geometry_geojson:
+        return False
+    try:
+        return json.loads(geometry_geojson) != json.loads(new_geometry_geojson)  # type: ignore
+    except (TypeError, json.JSONDecodeError):
+        return True
+
+
+_location_trigger_present: weakref.WeakKeyDictionary[psycopg2.extensions.connection, bool] = weakref.WeakKeyDictionary()
+
+
+def update_physical_object_location(cur: psycopg2.extensions.cursor, physical_object_id: int | str) -> None:
+    """Set administrative unit and municipality of the physical object by its center.
+
+    Databases having `set_physical_object_location` trigger (db_schema/physical_object_location_trigger.sql) fill them
+    on insert and geometry update, the presence of the trigger is checked once for every connection.
+    """
+    if cur.connection not in _location_trigger_present:
+        cur.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_trigger"
+            "   WHERE tgrelid = 'physical_objects'::regclass AND tgname = 'set_physical_object_location')"
+        )
+        _location_trigger_present[cur.connection] = cur.fetchone()[0]
+    if _location_trigger_present[cur.connection]:
+        return
+    cur.execute(
+        "UPDATE physical_objects p SET"
+        " administrative_unit_id = (SELECT id from administrative_units"
+        "   WHERE ST_CoveredBy(p.center, geometry) ORDER BY population DESC LIMIT 1),"
+        " municipality_id = (SELECT id from municipalities"
+        "   WHERE ST_CoveredBy(p.center, geometry) ORDER BY population DESC LIMIT 1)"
+        " WHERE id = %s",
+        (physical_object_id,),
+    )
+
+
+def update_physical_object_geometry(
+    cur: psycopg2.extensions.cursor, physical_object_id: int | str, geometry_geojson: str | None
+) -> tuple[float, float, str] | None:
+    """Set physical object geometry and center from the given GeoJSON, checking the geometry in the same query.
+
+    The update is executed inside a savepoint, so an incorrect geometry does not abort the current transaction. The
+    savepoint is sent in the same query as the update to save a round-trip.
+
+    Return new centroid (latitude, longitude, geometry type) if geometry is correct, None otherwise.
+    """
+    if geometry_geojson is None:
+        return None
+    try:
+        cur.execute(
+            "SAVEPOINT physical_object_geometry_update;"
+            " UPDATE physical_objects"
+            " SET geometry = ST_SnapToGrid(ST_SetSRID(ST_GeomFromGeoJSON(%(geometry)s), 4326), 0.000001),"
+            "   center = ST_SnapToGrid(ST_Centroid(ST_SetSRID(ST_GeomFromGeoJSON(%(geometry)s), 4326)), 0.000001),"
+            "   updated_at = date_trunc('second', now())"
+            " WHERE id = %(physical_object_id)s AND ST_IsValid(ST_GeomFromGeoJSON(%(geometry)s))"
+            " RETURNING ST_Y(center), ST_X(center), ST_GeometryType(geometry)",
+            {"geometry": geometry_geojson, "physical_object_id": physical_object_id},
+        )
+        res = cur.fetchone()
+        if res is not None:
+            update_physical_object_location(cur, physical_object_id)
+    except psycopg2.Error as exc:
+        logger.debug("Exception on physical object geometry update: {!r}", exc)
+        cur.execute("ROLLBACK TO SAVEPOINT physical_object_geometry_update")
+        return None
+    cur.execute("RELEASE SAVEPOINT physical_object_geometry_update")
+    return res
+
+
+_building_select_prepared: weakref.WeakSet[psycopg2.extensions.connection] = weakref.WeakSet()
+
+
+def select_building(cur: psycopg2.extensions.cursor, physical_object_id: int | str) -> tuple[Any, ...] | None:
+    """Select data for the building edit dialog: physical object GeoJSON geometry and osm_id, building address and
+    other editable parameters, and building id at the end.
+
+    The query is prepared once for every connection and executed by name after that.
+
+    Return None if there is no building with the given physical object.
+    """
+    if cur.connection not in _building_select_prepared:
+        cur.execute(
+            "PREPARE select_building(integer) AS"
+            " SELECT ST_AsGeoJSON(p.geometry), p.osm_id, b.address, b.building_year,"
+            "   b.repair_years, b.building_area, b.living_area,"
+            "   b.storeys_count, b.lift_count, b.resident_number, b.project_type,"
+            "   b.ukname, b.central_heating, b.central_hotwater,"
+            "   b.central_electro, b.central_gas, b.refusechute,"
+            "   b.failure, b.is_living, b.id"
+            " FROM buildings b"
+            "   JOIN physical_objects p ON b.physical_object_id = p.id"
+            " WHERE p.id = $1"
+        )
+        _building_select_prepared.add(cur.connection)
+    cur.execute("EXECUTE select_building(%s)", (physical_object_id,))
+    return cur.fetchone()
+
+
+def set_combobox_items(combobox: QtWidgets.QComboBox, items: Iterable[str], placeholder: str) -> None:
+    """Replace combobox items keeping the current item if it is still present, or set a single placeholder item if
+    there are no items. Change signals are not emitted, and popup width is set only if the longest item has changed.
+    """
+    items = list(items)
+    current_text = combobox.currentText()
+    max_len = max(map(len, items), default=0)
+    signals_blocked = combobox.blockSignals(True)
+    try:
+        combobox.clear()
+        if len(items) == 0:
+            combobox.addItem(placeholder)
+            max_len = len(placeholder)
+        else:
+            combobox.addItems(items)
+            if current_text in items:
+                combobox.setCurrentText(current_text)
+    finally:
+        combobox.blockSignals(signals_blocked)
+    if isinstance(combobox, ColorizingComboBox):
+        combobox.sync_state()
+    if combobox.view().minimumWidth() != max_len * 8:
+        combobox.view().setMinimumWidth(max_len * 8)
+
+
 class ColorizingLine(QtWidgets.QLineEdit):
     """Text line with an ability to set a hook for a change on focusOut event."""
 
@@ -83,6 +234,10 @@ class ColorizingComboBox(QtWidgets.QComboBox):
             if self.isVisible():
                 self._callback(self, old_state)
 
+    def sync_state(self) -> None:
+        """Set current index as the unchanged state without calling the callback."""
+        self._state = self.currentIndex()
+
     def __str__(self) -> str:
         return f'ColorizingComboBox("{self.currentText()}" / {self.currentIndex()}) at {hex(id(self))})'
 
@@ -195,6 +350,7 @@ class ColoringTableWidget(QtWidgets.QTableWidget):
         self._data = []
         self._initialized = False
         self._checker = correction_checker
+        self._labels = list(labels)
         self.setRowCount(len(data))
         self.setColumnCount(len(labels))
         self.setHorizontalHeaderLabels(labels)
@@ -229,6 +385,51 @@ class ColoringTableWidget(QtWidgets.QTableWidget):
             self._data[row][column] = data
         return super().dataChanged(top_left, bottom_right, roles=roles)
 
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Remove the given rows, each contiguous range of rows is removed at once."""
+        for _, group in itertools.groupby(
+            enumerate(sorted(set(rows), reverse=True)), key=lambda index_row: index_row[0] + index_row[1]
+        ):
+            rows_range = [row for _, row in group]
+            first_row = rows_range[-1]
+            self.model().removeRows(first_row, len(rows_range))
+            del self._data[first_row : first_row + len(rows_range)]
+
+    def iter_rows(self) -> Iterator[list[str]]:
+        """Iterate over the table rows as lists of cells texts."""
+        item = self.item
+        columns = range(self.columnCount())
+        for row in range(self.rowCount()):
+            yield [item(row, column).text() for column in columns]
+
+    def save_to_file(self, filename: str) -> None:
+        """Save the table to the CSV, XLSX, XLS or ODS file by its extension. CSV and XLSX files are written
+        row by row without collecting the whole table in memory.
+        """
+        if filename.endswith(".csv"):
+            with open(filename, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(self._labels)
+                writer.writerows(self.iter_rows())
+        elif filename.endswith(".xlsx"):
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet()
+            worksheet.append(self._labels)
+            for row in self.iter_rows():
+                worksheet.append(row)
+            workbook.save(filename)
+        else:
+            pd.DataFrame(self.iter_rows(), columns=self._labels).to_excel(filename, index=False)
+
+    @contextmanager
+    def updates_disabled(self) -> Iterator[None]:
+        """Disable table repainting inside the context, the table is repainted once on exit."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+
     def disable_triggers(self) -> None:
         """Disable calling callback on cell change."""
         self._initialized = False
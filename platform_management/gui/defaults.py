@@ -0,0 +1,12 @@
+"""Default values for the credentials window are located here."""
+from typing import NamedTuple
+
+InitWindowDefaultValues = NamedTuple(
+    "InitWindowDefaultValues",
+    [("db_address", str), ("db_port", int), ("db_name", str), ("db_user", str), ("db_pass", str)],
+)
+
+
+def get_init_window_default_values() -> InitWindowDefaultValues:
+    """Get default values fot credentials window."""
+    return InitWindowDefaultValues("127.0.0.1", 5432, "city_db_final", "postgres", "postgres")
@@ -16,16 +16,7 @@ from platform_management.gui.update_buildings import BuildingsUpdatingWindow
 from platform_management.gui.update_services import ServicesUpdatingWindow
 
 from .app import get_application
-
-InitWindowDefaultValues = NamedTuple(
-    "InitWindowDefaultValues",
-    [("db_address", str), ("db_port", int), ("db_name", str), ("db_user", str), ("db_pass", str)],
-)
-
-
-def get_init_window_default_values() -> InitWindowDefaultValues:
-    """Get default values fot credentials window."""
-    return InitWindowDefaultValues("127.0.0.1", 5432, "city_db_final", "postgres", "postgres")
+from .defaults import get_init_window_default_values
 
 
 class InitWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attributes
@@ -17,7 +17,13 @@ import platform_management.cli as insert_services_cli
 from platform_management.cli.services import get_properties_keys
 from platform_management.database_properties import Properties
 from platform_management.dto import ServiceInsertionMapping
-from platform_management.gui.basics import CheckableTableView, ColorizingComboBox, ColorizingLine, DropPushButton
+from platform_management.gui.basics import (
+    CheckableTableView,
+    ColorizingComboBox,
+    ColorizingLine,
+    DropPushButton,
+    set_combobox_items,
+)
 
 from .defaults import (
     get_default_city_functions,
@@ -367,16 +373,16 @@ class ServicesInsertionWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                 self._options_fields.city.currentText(),
                 self._options_fields.service_type.currentText(),
                 ServiceInsertionMapping(
-                    self._document_fields.latitude.currentText(),
-                    self._document_fields.longitude.currentText(),
-                    self._document_fields.geometry.currentText(),
-                    self._document_fields.name.currentText(),
-                    self._document_fields.opening_hours.currentText(),
-                    self._document_fields.website.currentText(),
-                    self._document_fields.phone.currentText(),
-                    self._document_fields.address.currentText(),
-                    self._document_fields.osm_id.currentText(),
-                    self._document_fields.capacity.currentText(),
+                    latitude=self._document_fields.latitude.currentText(),
+                    longitude=self._document_fields.longitude.currentText(),
+                    geometry=self._document_fields.geometry.currentText(),
+                    name=self._document_fields.name.currentText(),
+                    opening_hours=self._document_fields.opening_hours.currentText(),
+                    website=self._document_fields.website.currentText(),
+                    phone=self._document_fields.phone.currentText(),
+                    address=self._document_fields.address.currentText(),
+                    capacity=self._document_fields.capacity.currentText(),
+                    osm_id=self._document_fields.osm_id.currentText(),
                 ),
                 {
                     self._properties_group.itemAtPosition(i + 2, 0)
@@ -736,16 +742,7 @@ class ServicesInsertionWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
 
     def set_cities(self, cities: Iterable[str]):
         """Set available cities list. Called from outside on reconnection to the database."""
-        cities = list(cities)
-        current_city = self._options_fields.city.currentText()
-        self._options_fields.city.clear()
-        if len(cities) == 0:
-            self._options_fields.city.addItem("(Нет городов)")
-        else:
-            self._options_fields.city.addItems(cities)
-            if current_city in cities:
-                self._options_fields.city.setCurrentText(current_city)
-            self._options_fields.city.view().setMinimumWidth(len(max(cities, key=len)) * 8)
+        set_combobox_items(self._options_fields.city, cities, "(Нет городов)")
 
     def set_city_functions(self, city_functions_list: list[str]) -> None:
         """Set alailable city functions list. Called from outside on reconnection to the database."""
@@ -15,7 +15,7 @@ from tqdm import trange
 from platform_management.cli import refresh_materialized_views
 from platform_management.cli.operations import update_buildings_area, update_physical_objects_locations
 from platform_management.database_properties import Properties
-from platform_management.gui.basics import GeometryShow, check_geometry_correctness
+from platform_management.gui.basics import GeometryShow, check_geometry_correctness_pooled
 from platform_management.utils.converters import to_str
 
 from .cities_table import PlatformCitiesTableWidget
@@ -52,14 +52,6 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
         super().__init__(parent)
 
         self._db_properties = db_properties
-        try:
-            self._db_properties.connect_timeout = 1
-            self._additional_conn = self._db_properties.copy().conn
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("could not create an additional connection: {!r}", exc)
-            self._additional_conn = None  # type: ignore
-        finally:
-            self._db_properties.connect_timeout = 10
         self._on_close = on_close
         self._territory_window: TerritoryWindow | None = None
         self._regions = pd.Series(dtype=object)
@@ -180,9 +172,9 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
 
     def _on_city_add(self) -> None:
         dialog = CityCreationWidget("Добавление нового города", list(self._regions), is_adding=True)
-        if dialog.exec() != QtWidgets.QDialog.Accepted or self._additional_conn is None:
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._log_window.insertHtml("<font color=#e6783c>Город не добавлен, ошибка в геометрии</font><br>")
             return
@@ -270,9 +262,9 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
             division_type,
             local_crs,
         )
-        if dialog.exec() != QtWidgets.QDialog.Accepted or self._additional_conn is None:
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._log_window.insertHtml(
                 f'<font color=#e6783c>Город "{name}" с id={city_id} не изменен, ошибка в геометрии</font><br>'
@@ -440,11 +432,11 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
 
     def _on_show_municipalities(self) -> None:
         row = self._table.currentRow()
-        if row == -1 or self._additional_conn is None:
+        if row == -1:
             return
         self._territory_window = TerritoryWindow(
             self._db_properties.conn,
-            self._additional_conn,
+            self._db_properties,
             self._table.item(row, 1).text(),
             "municipality",
             self._on_municipality_add,
@@ -483,11 +475,11 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
 
     def _on_show_administrative_units(self) -> None:
         row = self._table.currentRow()
-        if row == -1 or self._additional_conn is None:
+        if row == -1:
             return
         self._territory_window = TerritoryWindow(
             self._db_properties.conn,
-            self._additional_conn,
+            self._db_properties,
             self._table.item(row, 1).text(),
             "administrative_unit",
             self._on_administrative_unit_add,
@@ -581,9 +573,6 @@ class CitiesWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-attr
     ) -> None:
         """Change database connection config. Called from the outside on reconnecting to the database."""
         self._db_properties.reopen(db_addr, db_port, db_name, db_user, db_pass)
-        if self._additional_conn is not None and not self._additional_conn.closed:
-            self._additional_conn.close()
-        self._additional_conn = self._db_properties.copy().conn
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # pylint: disable=invalid-name
         logger.info("Открыто окно работы с городами")
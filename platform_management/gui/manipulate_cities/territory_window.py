@@ -9,7 +9,8 @@ from typing import Callable, Literal, NamedTuple
 import psycopg2  # pylint: disable=unused-import
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from platform_management.gui.basics import GeometryShow, check_geometry_correctness
+from platform_management.database_properties import Properties
+from platform_management.gui.basics import GeometryShow, check_geometry_correctness_pooled
 from platform_management.utils.converters import to_str
 
 from .territories_table import PlatformTerritoriesTableWidget
@@ -32,7 +33,7 @@ class TerritoryWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-a
     def __init__(  # pylint: disable=too-many-arguments,too-many-statements
         self,
         conn: psycopg2.extensions.connection,
-        additional_conn: psycopg2.extensions.connection,
+        db_properties: Properties,
         city_name: str,
         territory_type: Literal["municipality", "administrative_unit"],
         on_territory_add_callback: Callable[[int, str, str], None],
@@ -43,7 +44,7 @@ class TerritoryWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-a
     ):
         super().__init__(parent)
         self._conn = conn
-        self._additional_conn = additional_conn
+        self._db_properties = db_properties
         self._territory_window: TerritoryWindow | None = None
         self._on_territory_add_callback = on_territory_add_callback
         self._on_territory_edit_callback = on_territory_edit_callback
@@ -147,7 +148,7 @@ class TerritoryWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-a
         )
         if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._on_error_callback(
                 f"Ошибка в геометрии при добавлении территории - {self._territory_name_what}"
@@ -217,7 +218,7 @@ class TerritoryWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-a
         if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
         changes = []
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._on_error_callback(
                 f'{self._territory_name_what} "{name}" с id={territory_id} для города'
@@ -9,7 +9,7 @@ from loguru import logger
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from platform_management.database_properties import Properties
-from platform_management.gui.basics import GeometryShow, check_geometry_correctness
+from platform_management.gui.basics import GeometryShow, check_geometry_correctness_pooled
 from platform_management.utils.converters import to_str
 
 from .region_creation import RegionCreation
@@ -40,14 +40,6 @@ class RegionsWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-att
         super().__init__(parent)
 
         self._db_properties = db_properties
-        try:
-            self._db_properties.connect_timeout = 1
-            self._additional_conn = self._db_properties.copy().conn
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("could not create an additional connection: {!r}", exc)
-            self._additional_conn = None  # type: ignore
-        finally:
-            self._db_properties.connect_timeout = 10
         self._on_close = on_close
 
         self._layout = QtWidgets.QHBoxLayout()
@@ -152,9 +144,9 @@ class RegionsWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-att
 
     def _on_region_add(self) -> None:
         dialog = RegionCreation("Добавление нового региона", is_adding=True)
-        if dialog.exec() != QtWidgets.QDialog.Accepted or self._additional_conn is None:
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._log_window.insertHtml("<font color=#e6783c>Регион не добавлен, ошибка в геометрии</font><br>")
             return
@@ -199,9 +191,9 @@ class RegionsWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-att
         dialog = RegionCreation(
             f"Внесение изменений в регион в строке под номером {row + 1}", json.dumps(geometry, indent=2), name, code
         )
-        if dialog.exec() != QtWidgets.QDialog.Accepted or self._additional_conn is None:
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
+        new_geom_tuple = check_geometry_correctness_pooled(dialog.get_geometry(), self._db_properties)
         if new_geom_tuple is None:
             self._log_window.insertHtml(
                 f'<font color=#e6783c>Регион "{name}" с id={city_id} не изменен, ошибка в геометрии</font><br>'
@@ -294,9 +286,6 @@ class RegionsWindow(QtWidgets.QWidget):  # pylint: disable=too-many-instance-att
     ) -> None:
         """Update database connection. Called from the outside on reconnection to the database."""
         self._db_properties.reopen(db_addr, db_port, db_name, db_user, db_pass)
-        if self._additional_conn is not None and not self._additional_conn.closed:
-            self._additional_conn.close()
-        self._additional_conn = self._db_properties.copy().conn
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # pylint: disable=invalid-name
         logger.info("Открыто окно работы с регионами")
@@ -8,7 +8,8 @@ from PySide6 import QtGui
 from platform_management.version import VERSION
 
 from .app import get_application
-from .init_window import InitWindow, InitWindowDefaultValues
+from .defaults import InitWindowDefaultValues
+from .init_window import InitWindow
 
 
 def run_gui(
@@ -1,6 +1,8 @@
 """Building creation widget is defined here."""
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from platform_management.utils.converters import (
@@ -213,3 +215,27 @@ class BuildingCreationWidget(QtWidgets.QDialog):  # pylint: disable=too-many-ins
     def is_living(self) -> bool | None:
         """Get is_living value set by user"""
         return bool_or_none(self._is_living.checkState())
+
+
+BUILDING_FIELDS: tuple[tuple[str, str, Callable[[BuildingCreationWidget], Any]], ...] = (
+    ("адрес", "address", BuildingCreationWidget.address),
+    ("дата постройки", "building_year", BuildingCreationWidget.building_year),
+    ("годы ремонта", "repair_years", BuildingCreationWidget.repair_years),
+    ("площадь здания", "building_area", BuildingCreationWidget.building_area),
+    ("жилая площадь", "living_area", BuildingCreationWidget.building_area_living),
+    ("этажность", "storeys_count", BuildingCreationWidget.storeys),
+    ("количество лифтов", "lift_count", BuildingCreationWidget.lift_count),
+    ("население", "resident_number", BuildingCreationWidget.population),
+    ("тип проекта", "project_type", BuildingCreationWidget.project_type),
+    ("название застройщика", "ukname", BuildingCreationWidget.ukname),
+    ("централизованное отопление", "central_heating", BuildingCreationWidget.central_heating),
+    ("централизованная горячая вода", "central_hotwater", BuildingCreationWidget.central_hotwater),
+    ("централизованное электричество", "central_electro", BuildingCreationWidget.central_electricity),
+    ("централизованный газ", "central_gas", BuildingCreationWidget.central_gas),
+    ("мусоропровод", "refusechute", BuildingCreationWidget.refusechute),
+    ("аварийность", "failure", BuildingCreationWidget.is_failing),
+    ("жилой", "is_living", BuildingCreationWidget.is_living),
+)
+"""Editable buildings table fields as (name for the user, database column, dialog getter), in the same order as
+the building columns are selected from the database.
+"""
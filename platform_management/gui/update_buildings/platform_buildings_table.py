@@ -42,6 +42,10 @@ class PlatformBuildingsTableWidget(ColoringTableWidget):
         "-",
     ]
     """Columns mapping to the database columns for editing purposes."""
+    LABELS_IDX = {label: i for i, label in enumerate(LABELS)}
+    """Table columns indexes by their names."""
+    LABELS_DB_IDX = {db_column: i for i, db_column in enumerate(LABELS_DB) if db_column != "-"}
+    """Table columns indexes by the database columns they are mapped to."""
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -60,7 +64,6 @@ class PlatformBuildingsTableWidget(ColoringTableWidget):
             assert len(PlatformBuildingsTableWidget.LABELS) + len(properties_keys) == len(
                 list(buildings[0])
             ), "size of a service table is not equal to a predefined table"
-        self._labels = PlatformBuildingsTableWidget.LABELS + properties_keys
         self._db_properties = db_properties
         self._changed_callback = changed_callback
         self._is_callback_enabled = True
@@ -71,13 +74,13 @@ class PlatformBuildingsTableWidget(ColoringTableWidget):
     def correction_checker(self, row: int, column: int, old_data: Any, new_data: str) -> bool:
         """Check if the changed element have a correct value."""
         res = True
-        if new_data is not None and column == self.LABELS_DB.index("address") and len(new_data) >= 128:
+        if new_data is not None and column == self.LABELS_DB_IDX["address"] and len(new_data) >= 128:
             res = False
-        elif column in (self.LABELS_DB.index("building_area"), self.LABELS_DB.index("living_area")) and (
+        elif column in (self.LABELS_DB_IDX["building_area"], self.LABELS_DB_IDX["living_area"]) and (
             new_data.count(".") >= 1 or not new_data.replace(".", "").isnumeric() or float(new_data) < 0
         ):
             res = False
-        elif column == self.LABELS_DB.index("is_living") and new_data.lower() not in ("true", "false", "0", "1"):
+        elif column == self.LABELS_DB_IDX["is_living"] and new_data.lower() not in ("true", "false", "0", "1"):
             res = False
         if self._is_callback_enabled and (
             column > len(PlatformBuildingsTableWidget.LABELS_DB)
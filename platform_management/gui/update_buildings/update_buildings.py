@@ -5,16 +5,21 @@ import json
 import time
 from typing import Any, Callable, Iterable, NamedTuple
 
-import pandas as pd
 from loguru import logger
+from psycopg2 import sql
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from platform_management.cli.buildings import get_properties_keys
 from platform_management.database_properties import Properties
-from platform_management.gui.basics import check_geometry_correctness
+from platform_management.gui.basics import (
+    is_geometry_changed,
+    select_building,
+    set_combobox_items,
+    update_physical_object_geometry,
+)
 from platform_management.utils.converters import to_str
 
-from .building_creation import BuildingCreationWidget
+from .building_creation import BUILDING_FIELDS, BuildingCreationWidget
 from .geometry_show import GeometryShowWidget
 from .platform_buildings_table import PlatformBuildingsTableWidget
 
@@ -44,14 +49,6 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
         super().__init__(parent)
 
         self._db_properties = db_properties
-        try:
-            self._db_properties.connect_timeout = 1
-            self._additional_conn = self._db_properties.copy().conn
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("could not create an additional connection: {!r}", exc)
-            self._additional_conn = None  # type: ignore
-        finally:
-            self._db_properties.connect_timeout = 10
         self._on_close = on_close
 
         self._layout = QtWidgets.QHBoxLayout()
@@ -118,17 +115,35 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
         self._log_window = QtWidgets.QTextEdit()
         self._log_window.setReadOnly(True)
         self._right.addWidget(self._log_window)
+        self._log_cursor = self._log_window.textCursor()
+        self._log_entries: list[str] = []
+        self._log_format_info = QtGui.QTextCharFormat()
+        self._log_format_info.setForeground(QtGui.QColor("blue"))
+        self._log_format_change = QtGui.QTextCharFormat()
+        self._log_format_change.setForeground(QtGui.QColor("yellowgreen"))
+        self._log_format_warning = QtGui.QTextCharFormat()
+        self._log_format_warning.setForeground(QtGui.QColor("#e6783c"))
+        self._log_format_delete = QtGui.QTextCharFormat()
+        self._log_format_delete.setForeground(QtGui.QColor("red"))
+        self._log_format_commit = QtGui.QTextCharFormat()
+        self._log_format_commit.setForeground(QtGui.QColor("green"))
 
         self._right.setAlignment(QtCore.Qt.AlignTop)
         self._city_choose.setMinimumWidth(200)
-        right_width = max(map(lambda box: box.sizeHint().width(), (self._options_group_box, self._editing_group_box)))
+        self._sized = False
 
-        self._right_scroll.setFixedWidth(int(right_width * 1.1))
-        self._options_group_box.setFixedWidth(right_width)
-        self._editing_group_box.setFixedWidth(right_width)
+    def _log(self, message: str, char_format: QtGui.QTextCharFormat) -> None:
+        """Append a line of the given format to the end of the log window and scroll to it."""
+        self._log_cursor.movePosition(QtGui.QTextCursor.End)
+        self._log_cursor.insertText(message, char_format)
+        self._log_cursor.insertBlock()
+        scrollbar = self._log_window.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+        self._log_entries.append(message)
 
     def _on_objects_load(self) -> None:
         self._log_window.clear()
+        self._log_entries.clear()
         self._db_properties.conn.rollback()
         properties_keys = get_properties_keys(
             self._db_properties.conn, self._city_choose.currentText(), self._show_living, self._show_non_living
@@ -147,8 +162,8 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                 "   ST_GeometryType(p.geometry),"
                 "   au.name as administrative_unit,"
                 "   m.name as municipality,"
-                "   date_trunc('second', p.created_at)::timestamp,"  # buildings do not have `created_at`
-                "   date_trunc('second', p.updated_at)::timestamp,"  # buildings do not have `updated_at`
+                "   date_trunc('second', p.created_at)::timestamp::text,"  # buildings do not have `created_at`
+                "   date_trunc('second', p.updated_at)::timestamp::text,"  # buildings do not have `updated_at`
                 "   b.properties"
                 " FROM physical_objects p"
                 "   JOIN buildings b ON b.physical_object_id = p.id"
@@ -189,39 +204,43 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
             buildings_list, properties_keys, self._on_cell_change, self._db_properties
         )
         self._table.disable_callback()
-        for i, properties in enumerate(buildings_properties):
-            properties: dict | None
-            if properties is None:
-                continue
-            for functional_object_property, value in properties.items():
-                self._table.item(
-                    i, len(PlatformBuildingsTableWidget.LABELS) + properties_keys.index(functional_object_property)
-                ).setText(str(value))
+        with self._table.updates_disabled():
+            properties_columns = {
+                key: len(PlatformBuildingsTableWidget.LABELS) + i for i, key in enumerate(properties_keys)
+            }
+            for i, properties in enumerate(buildings_properties):
+                properties: dict | None
+                if properties is None:
+                    continue
+                for building_property, value in properties.items():
+                    self._table.item(i, properties_columns[building_property]).setText(str(value))
         self._table.enable_callback()
         self._left.replaceWidget(left_placeholder, self._table)
 
-        self._log_window.insertHtml(f'<font color=blue>Работа с городом "{self._city_choose.currentText()}"</font><br>')
-        self._log_window.insertHtml(f"<font color=blue>Загружены {len(buildings_list)} зданий</font><br>")
+        self._log(f'Работа с городом "{self._city_choose.currentText()}"', self._log_format_info)
+        self._log(f"Загружены {len(buildings_list)} зданий", self._log_format_info)
 
     def _on_cell_change(  # pylint: disable=too-many-arguments
         self, row: int, column_name: str, old_value: Any, new_value: Any, is_valid: bool
     ) -> None:
         building_id = self._table.item(row, 0).text()
         if not is_valid:
-            self._log_window.insertHtml(
-                f"<font color=#e6783c>Не изменен объект с building_id="
+            self._log(
+                f"Не изменен объект с building_id="
                 f'{building_id}. {column_name}: "{to_str(old_value)}"->"{to_str(new_value)}"'
-                " (некорректное значение)</font><br>"
+                " (некорректное значение)",
+                self._log_format_warning,
             )
             return
         with self._db_properties.conn.cursor() as cur:
-            if column_name in PlatformBuildingsTableWidget.LABELS:
-                column = PlatformBuildingsTableWidget.LABELS.index(column_name)
-                db_column = PlatformBuildingsTableWidget.LABELS_DB[column]
+            if column_name in PlatformBuildingsTableWidget.LABELS_IDX:
+                db_column = PlatformBuildingsTableWidget.LABELS_DB[PlatformBuildingsTableWidget.LABELS_IDX[column_name]]
                 cur.execute(
-                    f"UPDATE buildings SET {db_column} = %s WHERE id = %s",
-                    (new_value, building_id),
+                    f"UPDATE buildings SET {db_column} = %s WHERE id = %s AND {db_column} IS DISTINCT FROM %s",
+                    (new_value, building_id, new_value),
                 )
+                if cur.rowcount == 0:
+                    return
                 # buildings do not have update date
                 cur.execute(
                     "WITH p_id AS (SELECT physical_object_id id FROM buildings WHERE id = %s)"
@@ -231,8 +250,9 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                 )
             else:
                 cur.execute(
-                    "UPDATE buildings SET properties = properties || %s::jsonb WHERE id = %s",
-                    (json.dumps({column_name: new_value}), building_id),
+                    "UPDATE buildings SET properties = properties || %s::jsonb"
+                    " WHERE id = %s AND properties->>%s IS DISTINCT FROM %s",
+                    (json.dumps({column_name: new_value}), building_id, column_name, new_value),
                 )
 
     def _on_object_delete(self) -> None:
@@ -251,24 +271,19 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                 self, "Удаление объекта", f"Вы уверены, что хотите удалить объект в строке под номером {object_row}?"
             )
         if is_deleting == QtWidgets.QMessageBox.StandardButton.Yes:
-            if len(rows) == 1:
-                self._log_window.insertHtml("<font color=red>Удаление объекта с func_id=</font>")
-            else:
-                self._log_window.insertHtml("<font color=red>Удаление объектов с func_id=</font>")
+            deleted_ids = [self._table.item(row - 1, 0).text() for row in rows]
             with self._db_properties.conn.cursor() as cur:
-                for i, row in enumerate(rows[::-1]):
-                    building_id = self._table.item(row - 1, 0).text()
-                    self._log_window.insertHtml(
-                        f'<font color=red>{building_id}{", " if i != len(rows) - 1 else ""}</font>'
-                    )
-                    self._log_window.repaint()
-                    cur.execute("SELECT physical_object_id FROM buildings WHERE id = %s", (building_id,))
-                    phys_id = cur.fetchone()[0]  # type: ignore
-                    cur.execute("DELETE FROM functional_objects WHERE physical_object_id = %s", (phys_id,))
-                    cur.execute("DELETE FROM buildings WHERE id = %s", (building_id,))
-                    cur.execute("DELETE FROM physical_objects WHERE id = %s", (phys_id,))
-                    self._table.removeRow(row - 1)
-                self._log_window.insertHtml("</font><br>")
+                cur.execute(
+                    "DELETE FROM buildings WHERE id = ANY(%s::integer[]) RETURNING physical_object_id", (deleted_ids,)
+                )
+                phys_ids = [phys_id for (phys_id,) in cur.fetchall()]
+                cur.execute("DELETE FROM functional_objects WHERE physical_object_id = ANY(%s)", (phys_ids,))
+                cur.execute("DELETE FROM physical_objects WHERE id = ANY(%s)", (phys_ids,))
+            self._table.remove_rows(row - 1 for row in rows)
+            self._log(
+                f"Удаление {'объекта' if len(rows) == 1 else 'объектов'} с func_id={', '.join(deleted_ids)}",
+                self._log_format_delete,
+            )
 
     def _on_geometry_show(self) -> None:
         with self._db_properties.conn.cursor() as cur:
@@ -276,7 +291,7 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                 "SELECT ST_AsGeoJSON(geometry, 6) FROM physical_objects WHERE id = %s",
                 (
                     self._table.item(
-                        self._table.currentRow(), PlatformBuildingsTableWidget.LABELS_DB.index("physical_object_id")
+                        self._table.currentRow(), PlatformBuildingsTableWidget.LABELS_DB_IDX["physical_object_id"]
                     ).text(),
                 ),
             )
@@ -288,25 +303,14 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
 
     def _on_update_building(self) -> None:  # pylint: disable=too-many-locals
         row = self._table.currentRow()
+        item = self._table.item
         building_id, phys_id = (
-            self._table.item(row, 0).text(),
-            self._table.item(row, PlatformBuildingsTableWidget.LABELS_DB.index("physical_object_id")).text(),
+            item(row, 0).text(),
+            item(row, PlatformBuildingsTableWidget.LABELS_DB_IDX["physical_object_id"]).text(),
         )
         with self._db_properties.conn.cursor() as cur:
-            cur.execute(
-                "SELECT ST_AsGeoJSON(p.geometry), p.osm_id, b.address, b.building_year,"
-                "   b.repair_years, b.building_area, b.living_area,"
-                "   b.storeys_count, b.lift_count, b.resident_number, b.project_type,"
-                "   b.ukname, b.central_heating, b.central_hotwater,"
-                "   b.central_electro, b.central_gas, b.refusechute,"
-                "   b.failure, b.is_living, b.id"
-                " FROM buildings b"
-                "   JOIN physical_objects p ON b.physical_object_id = p.id"
-                " WHERE p.id = %s",
-                (phys_id,),
-            )
             try:
-                geometry, *res, b_id = cur.fetchone()  # type: ignore
+                geometry, *res, b_id = select_building(cur, phys_id)  # type: ignore
             except TypeError:
                 QtWidgets.QMessageBox.critical(
                     self,
@@ -314,153 +318,108 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
                     "Здание, соответствующее физическому объекту" f" с id={phys_id} не найдено в базе данных",
                 )
                 return
-        geometry = json.loads(geometry)
+        geometry = json.dumps(json.loads(geometry), indent=2)
         dialog = BuildingCreationWidget(
             f"Если необходимо, измените параметры здания на строке {row + 1}",
-            json.dumps(geometry, indent=2),
+            geometry,
             *res,
         )
-        if dialog.exec() != QtWidgets.QDialog.Accepted or self._additional_conn is None:
-            return
-        new_geom_tuple = check_geometry_correctness(dialog.get_geometry(), self._additional_conn)
-        if new_geom_tuple is None:
-            self._log_window.insertHtml(
-                f"<font color=#e6783c>Здание с id={building_id}"
-                f" (build_id={b_id}) не обновлено, ошибка в геометрии</font><br>"
-            )
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
         if dialog.address() is None:
-            self._log_window.insertHtml(
-                f"<font color=#e6783c>Здание id={building_id}"
-                f" (build_id={b_id}) не обновлено, адрес не задан</font><br>"
+            self._log(
+                f"Здание id={building_id} (build_id={b_id}) не обновлено, адрес не задан", self._log_format_warning
             )
             return
-        new_geometry = json.loads(dialog.get_geometry())  # type: ignore
-        if geometry != new_geometry:
-            new_latitude, new_longitude, geom_type = new_geom_tuple
-            with self._db_properties.conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE physical_objects"
-                    " SET geometry = ST_SnapToGrid(ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326), 0.000001),"
-                    "   center = ST_SnapToGrid(ST_Centroid(ST_SetSRID(ST_GeomFromGeoJSON(%s), 4326)), 0.000001),"
-                    "   updated_at = date_trunc('second', now())"
-                    " WHERE id = %s",
-                    (dialog.get_geometry(),) * 2 + (phys_id,),
-                )
-                cur.execute(
-                    "UPDATE physical_objects SET"
-                    " administrative_unit_id = (SELECT id from administrative_units"
-                    "   WHERE ST_CoveredBy("
-                    "       (SELECT center FROM physical_objects WHERE id = %s), geometry)"
-                    "   ORDER BY population DESC LIMIT 1),"
-                    " municipality_id = (SELECT id from municipalities"
-                    "   WHERE ST_CoveredBy("
-                    "       (SELECT center FROM physical_objects WHERE id = %s), geometry)"
-                    "   ORDER BY population DESC LIMIT 1)"
-                    " WHERE id = %s",
-                    (phys_id,) * 3,
+        geometry_changed = is_geometry_changed(geometry, dialog.get_geometry())
+        building_changes: list[tuple[str, Any, Any]] = []
+        changed_values: dict[str, Any] = {}
+        for (name_interface, column, getter), old_value in zip(BUILDING_FIELDS, res[1:]):
+            new_value = getter(dialog)
+            if old_value != new_value:
+                building_changes.append((name_interface, old_value, new_value))
+                changed_values[column] = new_value
+        statements: list[sql.Composable] = []
+        if res[0] != dialog.osm_id():
+            statements.append(
+                sql.SQL(
+                    "UPDATE physical_objects SET osm_id = %(osm_id)s, updated_at = date_trunc('second', now())"
+                    " WHERE id = %(physical_object_id)s RETURNING id"
                 )
-            self._log_window.insertHtml(
-                f"<font color=yellowgreen>Геометрия здания с id={building_id} (phys_id={phys_id}) изменена:"
-                f" {self._table.item(row, 11).text()}({self._table.item(row, 9).text()},"
-                f" {self._table.item(row, 10).text()})"
-                f"->{geom_type}({new_latitude, new_longitude})</font><br>"
             )
-            self._table.item(row, 9).setText(str(new_latitude))
-            self._table.item(row, 10).setText(str(new_longitude))
-            self._table.item(row, 11).setText(geom_type)
-            for column in (9, 10, 11):
-                self._table.item(row, column).setBackground(QtCore.Qt.GlobalColor.yellow)
-        if res[0] != dialog.osm_id():
-            with self._db_properties.conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE physical_objects SET osm_id = %s, updated_at = date_trunc('second', now()) WHERE id = %s",
-                    (res[0], phys_id),
+        if len(changed_values) > 0:
+            statements.append(
+                sql.SQL("UPDATE buildings SET {} WHERE id = %(building_id)s RETURNING id").format(
+                    sql.SQL(", ").join(
+                        sql.SQL("{} = {}").format(sql.Identifier(column), sql.Placeholder(column))
+                        for column in changed_values
+                    )
                 )
-            self._log_window.insertHtml(
-                f"<font color=yellowgreen>Изменен параметр OpenStreetMapID для phys_id={phys_id}:"
-                f' "{res[0]}"->"{dialog.osm_id()}"</font><br>'
             )
         with self._db_properties.conn.cursor() as cur:
-            if res[1] != dialog.address():
-                self._table.item(row, 1).setText(dialog.address())  # type: ignore
-                self._table.item(row, 1).setBackground(QtCore.Qt.GlobalColor.yellow)
-            for name_interface, column, old_value, new_value in zip(
-                (
-                    "адрес",
-                    "дата постройки",
-                    "годы ремонта",
-                    "площадь здания",
-                    "жилая площадь",
-                    "этажность",
-                    "количество лифтов",
-                    "население",
-                    "тип проекта",
-                    "название застройщика",
-                    "централизованное отопление",
-                    "централизованная горячая вода",
-                    "централизованное электричество",
-                    "централизованный газ",
-                    "мусоропровод",
-                    "аварийность",
-                    "жилой",
-                ),
-                (
-                    "address",
-                    "building_year",
-                    "repair_years",
-                    "building_area",
-                    "living_area",
-                    "storeys_count",
-                    "lift_count",
-                    "resident_number",
-                    "project_type",
-                    "ukname",
-                    "central_heating",
-                    "central_hotwater",
-                    "central_electro",
-                    "central_gas",
-                    "refusechute",
-                    "failure",
-                    "is_living",
-                ),
-                res[1:],
-                (
-                    dialog.address(),
-                    dialog.building_year(),
-                    dialog.repair_years(),
-                    dialog.building_area(),
-                    dialog.building_area_living(),
-                    dialog.storeys(),
-                    dialog.lift_count(),
-                    dialog.population(),
-                    dialog.project_type(),
-                    dialog.ukname(),
-                    dialog.central_heating(),
-                    dialog.central_hotwater(),
-                    dialog.central_electricity(),
-                    dialog.central_gas(),
-                    dialog.refusechute(),
-                    dialog.is_failing(),
-                    dialog.is_living(),
-                ),
-            ):
-                if old_value != new_value:
-                    self._log_window.insertHtml(
-                        f"<font color=yellowgreen>Изменен параметр дома ({name_interface})"
-                        f" для build_id={b_id} (phys_id={phys_id}):"
-                        f' "{to_str(old_value)}"->"{to_str(new_value)}"</font><br>'
+            # geometry and physical object changes are rolled back if the building itself is not updated
+            cur.execute("SAVEPOINT building_update")
+            if geometry_changed:
+                new_geom_tuple = update_physical_object_geometry(cur, phys_id, dialog.get_geometry())
+                if new_geom_tuple is None:
+                    cur.execute("RELEASE SAVEPOINT building_update")
+                    self._log(
+                        f"Здание с id={building_id} (build_id={b_id}) не обновлено, ошибка в геометрии",
+                        self._log_format_warning,
                     )
-                cur.execute(f"UPDATE buildings SET {column} = %s WHERE id = %s", (new_value, b_id))
+                    return
+            if len(statements) > 0:
+                cur.execute(
+                    statements[0]
+                    if len(statements) == 1
+                    else sql.SQL("WITH physical_object AS ({}) {}").format(*statements),
+                    {
+                        "osm_id": dialog.osm_id(),
+                        "physical_object_id": phys_id,
+                        "building_id": b_id,
+                    }
+                    | changed_values,
+                )
+                if cur.fetchone() is None:
+                    cur.execute("ROLLBACK TO SAVEPOINT building_update")
+                    cur.execute("RELEASE SAVEPOINT building_update")
+                    self._log(
+                        f"Здание id={building_id} (build_id={b_id}) не обновлено, здание не найдено в базе данных",
+                        self._log_format_warning,
+                    )
+                    return
+            cur.execute("RELEASE SAVEPOINT building_update")
+        with self._table.updates_disabled():
+            if geometry_changed:
+                new_latitude, new_longitude, geom_type = new_geom_tuple
+                self._log(
+                    f"Геометрия здания с id={building_id} (phys_id={phys_id}) изменена:"
+                    f" {item(row, 11).text()}({item(row, 9).text()},"
+                    f" {item(row, 10).text()})"
+                    f"->{geom_type}({new_latitude, new_longitude})",
+                    self._log_format_change,
+                )
+                for column, value in ((9, str(new_latitude)), (10, str(new_longitude)), (11, geom_type)):
+                    table_item = item(row, column)
+                    table_item.setText(value)
+                    table_item.setBackground(QtCore.Qt.GlobalColor.yellow)
+            if res[0] != dialog.osm_id():
+                self._log(
+                    f'Изменен параметр OpenStreetMapID для phys_id={phys_id}: "{res[0]}"->"{dialog.osm_id()}"',
+                    self._log_format_change,
+                )
+            if res[1] != dialog.address():
+                item(row, 1).setText(dialog.address())  # type: ignore
+                item(row, 1).setBackground(QtCore.Qt.GlobalColor.yellow)
+            for name_interface, old_value, new_value in building_changes:
+                self._log(
+                    f"Изменен параметр дома ({name_interface})"
+                    f" для build_id={b_id} (phys_id={phys_id}):"
+                    f' "{to_str(old_value)}"->"{to_str(new_value)}"',
+                    self._log_format_change,
+                )
 
     def _on_export(self) -> None:
-        lines: list[list[Any]] = []
-        for row in range(self._table.rowCount()):
-            lines.append([self._table.item(row, col).text() for col in range(self._table.columnCount())])
-        dataframe = pd.DataFrame(
-            lines, columns=[self._table.horizontalHeaderItem(i).text() for i in range(self._table.columnCount())]
-        )
-
         file_dialog = QtWidgets.QFileDialog(self)
         file_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
         file_dialog.setNameFilters(
@@ -473,7 +432,7 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
         )
         t = time.localtime()  # pylint: disable=invalid-name
         filename: str = (
-            f"{self._service_type.currentText()} {t.tm_year}-{t.tm_mon:02}-{t.tm_mday:02} "
+            f"{self._city_choose.currentText()} {t.tm_year}-{t.tm_mon:02}-{t.tm_mday:02} "
             f"{t.tm_hour:02}-{t.tm_min:02}-{t.tm_sec:02}.csv"
         )
         file_dialog.selectNameFilter("CSV files (*.csv)")
@@ -484,17 +443,16 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
         file_format = file_dialog.selectedNameFilter()[file_dialog.selectedNameFilter().rfind(".") : -1]
         if not filename.endswith(file_format):
             filename += file_format
-        save_func = pd.DataFrame.to_csv if filename.endswith("csv") else pd.DataFrame.to_excel
-        save_func(dataframe, filename, index=False)
+        self._table.save_to_file(filename)
 
     def _on_commit_changes(self) -> None:
-        self._log_window.insertHtml("<font color=green>Запись изменений в базу данных</font><br>")
+        self._log("Запись изменений в базу данных", self._log_format_commit)
         logger.opt(colors=True).info(
-            f"<green>Коммит следующих изменений зданий в базу данных</green>:\n{self._log_window.toPlainText()[:-1]}"
+            "<green>Коммит следующих изменений зданий в базу данных</green>:\n" + "\n".join(self._log_entries)
         )
         self._db_properties.conn.commit()
         self._edit_buttons.load.click()
-        self._log_window.insertHtml("<font color=green>Изменения записаны, обновленная информация загружена</font><br>")
+        self._log("Изменения записаны, обновленная информация загружена", self._log_format_commit)
 
     def _on_rollback(self) -> None:
         self._db_properties.conn.rollback()
@@ -502,28 +460,26 @@ class BuildingsUpdatingWindow(QtWidgets.QWidget):  # pylint: disable=too-many-in
 
     def set_cities(self, cities: Iterable[str]) -> None:
         """Set cities list. Called from the outside if the connection to the database has changed."""
-        cities = list(cities)
-        current_city = self._city_choose.currentText()
-        self._city_choose.clear()
-        if len(cities) == 0:
-            self._city_choose.addItem("(Нет городов)")
-        else:
-            self._city_choose.addItems(cities)
-            if current_city in cities:
-                self._city_choose.setCurrentText(current_city)
-            self._city_choose.view().setMinimumWidth(len(max(cities, key=len)) * 8)
+        set_combobox_items(self._city_choose, cities, "(Нет городов)")
 
     def change_db(  # pylint: disable=too-many-arguments
         self, db_addr: str, db_port: int, db_name: str, db_user: str, db_pass: str
     ) -> None:
         """Uptdate database connection. Called from the outside if the connection to the database has changed."""
         self._db_properties.reopen(db_addr, db_port, db_name, db_user, db_pass)
-        if self._additional_conn is not None and not self._additional_conn.closed:
-            self._additional_conn.close()
-        self._additional_conn = self._db_properties.copy().conn
+
+    def _set_right_width(self) -> None:
+        """Fix the right panel width by the size hints of its group boxes. Called on the first show of the window."""
+        right_width = max(map(lambda box: box.sizeHint().width(), (self._options_group_box, self._editing_group_box)))
+        self._right_scroll.setFixedWidth(int(right_width * 1.1))
+        self._options_group_box.setFixedWidth(right_width)
+        self._editing_group_box.setFixedWidth(right_width)
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # pylint: disable=invalid-name
         logger.info("Открыто окно изменения зданий")
+        if not self._sized:
+            self._set_right_width()
+            self._sized = True
         return super().showEvent(event)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # pylint: disable=invalid-name
@@ -45,6 +45,10 @@ class PlatformServicesTableWidget(ColoringTableWidget):
         "-",
     ]
     """Columns mapping to the database columns for editing purposes."""
+    LABELS_IDX = {label: i for i, label in enumerate(LABELS)}
+    """Table columns indexes by their names."""
+    LABELS_DB_IDX = {db_column: i for i, db_column in enumerate(LABELS_DB) if db_column != "-"}
+    """Table columns indexes by the database columns they are mapped to."""
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -64,7 +68,6 @@ class PlatformServicesTableWidget(ColoringTableWidget):
             assert len(PlatformServicesTableWidget.LABELS) + len(properties_keys) == len(
                 list(services[0])
             ), "size of a service table is not equal to a predefined table"
-        self._labels = PlatformServicesTableWidget.LABELS + properties_keys
         self._db_properties = db_properties
         self._changed_callback = changed_callback
         self._is_service_building = is_service_building
@@ -1,8 +1,9 @@
 """
 Click cli launchnig options are defined here.
+
+Subcommands modules are imported by the `main` group only when the corresponding subcommand is requested.
 """
 
-from . import gui, insert_adms_cli, insert_blocks_cli, insert_buildings_cli, insert_services_cli, operations
 from .main_group import main
 
 __all__ = [
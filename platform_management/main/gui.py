@@ -1,10 +1,12 @@
 """Graphical User Interface launching point is located here."""
 import click
 
-from platform_management.gui import InitWindow, run_gui
+from platform_management.gui.defaults import get_init_window_default_values
 
 from .main_group import main
 
+_default_values = get_init_window_default_values()
+
 
 @main.command()
 @click.option(
@@ -12,7 +14,7 @@ from .main_group import main
     "-H",
     envvar="DB_ADDR",
     help="Postgres DBMS address",
-    default=InitWindow.default_values.db_address,
+    default=_default_values.db_address,
     show_default=True,
     show_envvar=True,
 )
@@ -22,7 +24,7 @@ from .main_group import main
     envvar="DB_PORT",
     type=int,
     help="Postgres DBMS port",
-    default=InitWindow.default_values.db_port,
+    default=_default_values.db_port,
     show_default=True,
     show_envvar=True,
 )
@@ -31,7 +33,7 @@ from .main_group import main
     "-D",
     envvar="DB_NAME",
     help="Postgres city database name",
-    default=InitWindow.default_values.db_name,
+    default=_default_values.db_name,
     show_default=True,
     show_envvar=True,
 )
@@ -40,7 +42,7 @@ from .main_group import main
     "-U",
     envvar="DB_USER",
     help="Postgres DBMS user name",
-    default=InitWindow.default_values.db_user,
+    default=_default_values.db_user,
     show_default=True,
     show_envvar=True,
 )
@@ -49,7 +51,7 @@ from .main_group import main
     "-W",
     envvar="DB_PASS",
     help="Postgres DBMS user password",
-    default=InitWindow.default_values.db_pass,
+    default=_default_values.db_pass,
     show_default=True,
     show_envvar=True,
 )
@@ -58,4 +60,6 @@ def gui(
     db_addr: str, db_port: int, db_name: str, db_user: str, db_pass: str, verbose: bool
 ):  # pylint: disable=too-many-arguments
     "Graphical User Interface"
+    from platform_management.gui import run_gui  # pylint: disable=import-outside-toplevel
+
     run_gui(db_addr, db_port, db_name, db_user, db_pass, verbose)
@@ -3,80 +3,15 @@ from __future__ import annotations
 
 import click
 
-from platform_management.cli.adm_division import AdmDivisionType
-from platform_management.cli.run_cli import insert_adms_cli
+from platform_management.cli.common import AdmDivisionType
 from platform_management.dto import AdmDivisionInsertionMapping, DatabaseCredentials
 
-from .main_group import main
+from .main_group import common_db_options, insertion_options, main
 
 
 @main.command()
-@click.option(
-    "--db_addr",
-    "-H",
-    envvar="DB_ADDR",
-    help="Postgres DBMS address",
-    default="localhost",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_port",
-    "-P",
-    envvar="DB_PORT",
-    type=int,
-    help="Postgres DBMS port",
-    default=5432,
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_name",
-    "-D",
-    envvar="DB_NAME",
-    help="Postgres city database name",
-    default="city_db_final",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_user",
-    "-U",
-    envvar="DB_USER",
-    help="Postgres DBMS user name",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_pass",
-    "-W",
-    envvar="DB_PASS",
-    help="Postgres DBMS user password",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--dry_run",
-    "-d",
-    envvar="DRY_RUN",
-    is_flag=True,
-    help="Try to insert objects, but do not save results",
-    show_envvar=True,
-)
-@click.option(
-    "--verbose", "-v", envvar="VERBOSE", is_flag=True, help="Output stack trace when error happens", show_envvar=True
-)
-@click.option(
-    "--log_filename",
-    "-l",
-    envvar="LOGFILE",
-    help='path to create log file, empty or "-" to disable logging',
-    required=False,
-    show_default='current datetime "YYYY-MM-DD HH-mm-ss-<filename>.csv"',
-    show_envvar=True,
-)
+@common_db_options
+@insertion_options
 @click.option(
     "--city",
     "-c",
@@ -180,6 +115,8 @@ def insert_adms(
     filename: str,
 ):  # pylint: disable=too-many-arguments,too-many-locals,
     "Insert administrative division units from geojson via command line"
+    from platform_management.cli import insert_adms_cli  # pylint: disable=import-outside-toplevel
+
     insert_adms_cli(
         DatabaseCredentials(db_addr, db_port, db_name, db_user, db_pass),
         dry_run,
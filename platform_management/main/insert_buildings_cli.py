@@ -1,82 +1,78 @@
 """Buildings insertion command-line utility input information is defined here."""
 from __future__ import annotations
 
+from typing import Callable
+
 import click
 
-from platform_management.cli import insert_buildings_cli
 from platform_management.cli.defaults import InsertBuildings as DefaultValues
 from platform_management.dto import BuildingInsertionCLIParameters, DatabaseCredentials
 
-from .main_group import main
+from .main_group import common_db_options, insertion_options, main
+
+_DOCUMENT_OPTIONS = (
+    ("document_geometry", "-dg", "DOCUMENT_GEOMETRY", "Document geometry field name"),
+    ("document_address", "-dA", "DOCUMENT_ADDRESS", "Document building address field name"),
+    ("document_project_type", "-dP", "DOCUMENT_PROJCET_TYPE", "Document building project type name field name"),
+    ("document_living_area", "-dL", "DOCUMENT_LIVING_AREA", "Document building living area field name"),
+    ("document_storeys_count", "-dS", "DOCUMENT_STOREYS_COUNT", "Document buildings storeys count field name"),
+    (
+        "document_resident_number",
+        "-dR",
+        "DOCUMENT_RESIDENT_NUMBER",
+        "Document buildings resident number count field name",
+    ),
+    ("document_osm_id", "-dI", "DOCUMENT_OSM_ID", "Document physical object OSM identifier field field name"),
+    ("document_central_heating", "-dCH", "DOCUMENT_CENTRAL_HEATING", "Document building central heating field name"),
+    ("document_central_water", "-dCC", "DOCUMENT_CENTRAL_WATER", "Document building central water field name"),
+    (
+        "document_central_hot_water",
+        "-dCW",
+        "DOCUMENT_CENTRAL_HOT_WATER",
+        "Document building central hot water field name",
+    ),
+    (
+        "document_central_electricity",
+        "-dCE",
+        "DOCUMENT_CENTRAL_ELECTRICITY",
+        "Document building central electricity field name",
+    ),
+    ("document_central_gas", "-dCG", "DOCUMENT_CENTRAL_GAS", "Document building central gas field name"),
+    ("document_refusechute", "-dR", "DOCUMENT_REFUSECHUTE", "Document building refusechute field name"),
+    ("document_ukname", "-dU", "DOCUMENT_UKNAME", "Document building company field name"),
+    ("document_is_failing", "-dF", "DOCUMENT_IS_FAILING", "Document building is_failing field name"),
+    ("document_lift_count", "-dL", "DOCUMENT_LIFT_COUNT", "Document building lift count field name"),
+    ("document_repair_years", "-dF", "DOCUMENT_REPAIR_YEARS", "Document building repair_years field name"),
+    ("document_is_living", "-dL", "DOCUMENT_IS_LIVING", "Document building is_living field name"),
+    ("document_building_year", "-dL", "DOCUMENT_BUILDING_YEAR", "Document building built year"),
+    (
+        "document_modeled",
+        "-dM",
+        "DOCUMENT_MODELED",
+        "Document modeled fields (as in document, separated by comma) field name",
+    ),
+)
+"""Document field names options as (option name, short option, environment variable, help text)."""
+
+
+def _document_options(func: Callable) -> Callable:
+    """Add document field names options, each of them can be set multiple times."""
+    for name, short_name, envvar, help_text in reversed(_DOCUMENT_OPTIONS):
+        func = click.option(
+            f"--{name}",
+            short_name,
+            envvar=envvar,
+            help=help_text,
+            show_default=getattr(DefaultValues, name),
+            multiple=True,
+            show_envvar=True,
+        )(func)
+    return func
 
 
 @main.command()
-@click.option(
-    "--db_addr",
-    "-H",
-    envvar="DB_ADDR",
-    help="Postgres DBMS address",
-    default="localhost",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_port",
-    "-P",
-    envvar="DB_PORT",
-    type=int,
-    help="Postgres DBMS port",
-    default=5432,
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_name",
-    "-D",
-    envvar="DB_NAME",
-    help="Postgres city database name",
-    default="city_db_final",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_user",
-    "-U",
-    envvar="DB_USER",
-    help="Postgres DBMS user name",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_pass",
-    "-W",
-    envvar="DB_PASS",
-    help="Postgres DBMS user password",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--dry_run",
-    "-d",
-    envvar="DRY_RUN",
-    is_flag=True,
-    help="Try to insert objects, but do not save results",
-    show_envvar=True,
-)
-@click.option(
-    "--verbose", "-v", envvar="VERBOSE", is_flag=True, help="Output stack trace when error happens", show_envvar=True
-)
-@click.option(
-    "--log_filename",
-    "-l",
-    envvar="LOGFILE",
-    help='path to create log file, empty or "-" to disable logging',
-    required=False,
-    show_default='current datetime "YYYY-MM-DD HH-mm-ss-<filename>.csv"',
-    show_envvar=True,
-)
+@common_db_options
+@insertion_options
 @click.option(
     "--city",
     "-c",
@@ -85,186 +81,7 @@ from .main_group import main
     help="City to insert services to, must exist in the database",
     show_envvar=True,
 )
-@click.option(
-    "--document_geometry",
-    "-dg",
-    envvar="DOCUMENT_GEOMETRY",
-    help="Document geometry field name",
-    show_default=DefaultValues.document_geometry,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_address",
-    "-dA",
-    envvar="DOCUMENT_ADDRESS",
-    help="Document building address field name",
-    show_default=DefaultValues.document_address,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_project_type",
-    "-dP",
-    envvar="DOCUMENT_PROJCET_TYPE",
-    help="Document building project type name field name",
-    show_default=DefaultValues.document_project_type,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_living_area",
-    "-dL",
-    envvar="DOCUMENT_LIVING_AREA",
-    help="Document building living area field name",
-    show_default=DefaultValues.document_living_area,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_storeys_count",
-    "-dS",
-    envvar="DOCUMENT_STOREYS_COUNT",
-    help="Document buildings storeys count field name",
-    show_default=DefaultValues.document_storeys_count,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_resident_number",
-    "-dR",
-    envvar="DOCUMENT_RESIDENT_NUMBER",
-    help="Document buildings resident number count field name",
-    show_default=DefaultValues.document_resident_number,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_osm_id",
-    "-dI",
-    envvar="DOCUMENT_OSM_ID",
-    help="Document physical object OSM identifier field field name",
-    show_default=DefaultValues.document_osm_id,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_central_heating",
-    "-dCH",
-    envvar="DOCUMENT_CENTRAL_HEATING",
-    help="Document building central heating field name",
-    show_default=DefaultValues.document_central_heating,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_central_water",
-    "-dCC",
-    envvar="DOCUMENT_CENTRAL_WATER",
-    help="Document building central water field name",
-    show_default=DefaultValues.document_central_water,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_central_hot_water",
-    "-dCW",
-    envvar="DOCUMENT_CENTRAL_HOT_WATER",
-    help="Document building central hot water field name",
-    show_default=DefaultValues.document_central_hot_water,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_central_electricity",
-    "-dCE",
-    envvar="DOCUMENT_CENTRAL_ELECTRICITY",
-    help="Document building central electricity field name",
-    show_default=DefaultValues.document_central_electricity,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_central_gas",
-    "-dCG",
-    envvar="DOCUMENT_CENTRAL_GAS",
-    help="Document building central gas field name",
-    show_default=DefaultValues.document_central_gas,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_refusechute",
-    "-dR",
-    envvar="DOCUMENT_REFUSECHUTE",
-    help="Document building refusechute field name",
-    show_default=DefaultValues.document_refusechute,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_ukname",
-    "-dU",
-    envvar="DOCUMENT_UKNAME",
-    help="Document building company field name",
-    show_default=DefaultValues.document_ukname,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_is_failing",
-    "-dF",
-    envvar="DOCUMENT_IS_FAILING",
-    help="Document building is_failing field name",
-    show_default=DefaultValues.document_is_failing,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_lift_count",
-    "-dL",
-    envvar="DOCUMENT_LIFT_COUNT",
-    help="Document building lift count field name",
-    show_default=DefaultValues.document_lift_count,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_repair_years",
-    "-dF",
-    envvar="DOCUMENT_REPAIR_YEARS",
-    help="Document building repair_years field name",
-    show_default=DefaultValues.document_repair_years,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_is_living",
-    "-dL",
-    envvar="DOCUMENT_IS_LIVING",
-    help="Document building is_living field name",
-    show_default=DefaultValues.document_is_living,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_building_year",
-    "-dL",
-    envvar="DOCUMENT_BUILDING_YEAR",
-    help="Document building built year",
-    show_default=DefaultValues.document_building_year,
-    multiple=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_modeled",
-    "-dM",
-    envvar="DOCUMENT_MODELED",
-    help="Document modeled fields (as in document, separated by comma) field name",
-    show_default=DefaultValues.document_modeled,
-    multiple=True,
-    show_envvar=True,
-)
+@_document_options
 @click.option(
     "--address_prefix",
     "-aP",
@@ -291,7 +108,7 @@ from .main_group import main
     show_default=DefaultValues.properties_mapping,
     show_envvar=True,
 )
-@click.argument("filename", type=click.Path(exists=True, dir_okay=False))
+@click.argument("filename", type=click.Path(dir_okay=False))
 def insert_buildings(
     db_addr: str,
     db_port: int,
@@ -339,27 +156,29 @@ def insert_buildings(
     Modeled column should contain document columnd separated by comma. Corresponding table columns will be
     marked modeled on insert.
     """
+    from platform_management.cli import insert_buildings_cli  # pylint: disable=import-outside-toplevel
+
     columns_mapping = BuildingInsertionCLIParameters(
-        document_geometry,
-        document_address,
-        document_project_type,
-        document_living_area,
-        document_storeys_count,
-        document_resident_number,
-        document_osm_id,
-        document_central_heating,
-        document_central_water,
-        document_central_hot_water,
-        document_central_electricity,
-        document_central_gas,
-        document_refusechute,
-        document_ukname,
-        document_is_failing,
-        document_lift_count,
-        document_repair_years,
-        document_is_living,
-        document_building_year,
-        document_modeled,
+        geometry=document_geometry,
+        address=document_address,
+        project_type=document_project_type,
+        living_area=document_living_area,
+        storeys_count=document_storeys_count,
+        resident_number=document_resident_number,
+        osm_id=document_osm_id,
+        central_heating=document_central_heating,
+        central_water=document_central_water,
+        central_hot_water=document_central_hot_water,
+        central_electricity=document_central_electricity,
+        central_gas=document_central_gas,
+        refusechute=document_refusechute,
+        ukname=document_ukname,
+        is_failing=document_is_failing,
+        lift_count=document_lift_count,
+        repair_years=document_repair_years,
+        is_living=document_is_living,
+        building_year=document_building_year,
+        modeled=document_modeled,
     )
     insert_buildings_cli(
         DatabaseCredentials(db_addr, db_port, db_name, db_user, db_pass),
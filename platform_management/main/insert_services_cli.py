@@ -1,81 +1,65 @@
 """Services insertion command-line utility input information is defined here."""
 from __future__ import annotations
 
+from typing import Callable
+
 import click
 
-from platform_management.cli import insert_services_cli
 from platform_management.dto import DatabaseCredentials, ServiceInsertionMapping
 
-from .main_group import main
+from .main_group import common_db_options, insertion_options, main
+
+_DOCUMENT_OPTIONS = (
+    ("document_latitude", "-dx", "DOCUMENT_LATITUDE", "Document latutude field (this and longitude or geometry)", "x"),
+    (
+        "document_longitude",
+        "-dy",
+        "DOCUMENT_LONGITUDE",
+        "Document longitude field (this and latitude or geometry)",
+        "y",
+    ),
+    (
+        "document_geometry",
+        "-dg",
+        "DOCUMENT_GEOMETRY",
+        "Document geometry field (this or latitude and longitude)",
+        "geometry",
+    ),
+    ("document_address", "-dA", "DOCUMENT_ADDRESS", "Document service building address field", "yand_adr"),
+    ("document_service_name", "-dN", "DOCUMENT_SERVICE_NAME", "Document service name field", "name"),
+    (
+        "document_opening_hours",
+        "-dO",
+        "DOCUMENT_OPENING_HOURS",
+        "Document service opening hours field",
+        "opening_hours",
+    ),
+    ("document_website", "-dw", "DOCUMENT_WEBSITE", "Document service website field", "contact:website"),
+    ("document_phone", "-dP", "DOCUMENT_PHONE", "Document service phone number field", "contact:phone"),
+    ("document_osm_id", "-dI", "DOCUMENT_OSM_ID", "Document physical object OSM identifier field", "id"),
+    ("document_capacity", "-dC", "DOCUMENT_CAPACITY", "Document service capacity field", "-"),
+)
+"""Document field names options as (option name, short option, environment variable, help text, default)."""
+
+
+def _document_options(func: Callable) -> Callable:
+    """Add document field names options."""
+    for name, short_name, envvar, help_text, default in reversed(_DOCUMENT_OPTIONS):
+        func = click.option(
+            f"--{name}",
+            short_name,
+            envvar=envvar,
+            help=help_text,
+            default=default,
+            show_default=True,
+            show_envvar=True,
+        )(func)
+    return func
 
 
 @main.command()
-@click.option(
-    "--db_addr",
-    "-H",
-    envvar="DB_ADDR",
-    help="Postgres DBMS address",
-    default="localhost",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_port",
-    "-P",
-    envvar="DB_PORT",
-    type=int,
-    help="Postgres DBMS port",
-    default=5432,
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_name",
-    "-D",
-    envvar="DB_NAME",
-    help="Postgres city database name",
-    default="city_db_final",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_user",
-    "-U",
-    envvar="DB_USER",
-    help="Postgres DBMS user name",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_pass",
-    "-W",
-    envvar="DB_PASS",
-    help="Postgres DBMS user password",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--dry_run",
-    "-d",
-    envvar="DRY_RUN",
-    is_flag=True,
-    help="Try to insert objects, but do not save results",
-    show_envvar=True,
-)
-@click.option(
-    "--verbose", "-v", envvar="VERBOSE", is_flag=True, help="Output stack trace when error happens", show_envvar=True
-)
-@click.option(
-    "--log_filename",
-    "-l",
-    envvar="LOGFILE",
-    help='path to create log file, empty or "-" to disable logging',
-    required=False,
-    show_default='current datetime "YYYY-MM-DD HH-mm-ss-<filename>.csv"',
-    show_envvar=True,
-)
+@common_db_options
+@insertion_options
 @click.option(
     "--city",
     "-c",
@@ -94,96 +78,7 @@ from .main_group import main
     show_envvar=True,
     required=True,
 )
-@click.option(
-    "--document_latitude",
-    "-dx",
-    envvar="DOCUMENT_LATITUDE",
-    help="Document latutude field (this and longitude or geometry)",
-    default="x",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_longitude",
-    "-dy",
-    envvar="DOCUMENT_LONGITUDE",
-    help="Document longitude field (this and latitude or geometry)",
-    default="y",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_geometry",
-    "-dg",
-    envvar="DOCUMENT_GEOMETRY",
-    help="Document geometry field (this or latitude and longitude)",
-    default="geometry",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_address",
-    "-dA",
-    envvar="DOCUMENT_ADDRESS",
-    help="Document service building address field",
-    default="yand_adr",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_service_name",
-    "-dN",
-    envvar="DOCUMENT_SERVICE_NAME",
-    help="Document service name field",
-    default="name",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_opening_hours",
-    "-dO",
-    envvar="DOCUMENT_OPENING_HOURS",
-    help="Document service opening hours field",
-    default="opening_hours",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_website",
-    "-dw",
-    envvar="DOCUMENT_WEBSITE",
-    help="Document service website field",
-    default="contact:website",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_phone",
-    "-dP",
-    envvar="DOCUMENT_PHONE",
-    help="Document service phone number field",
-    default="contact:phone",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_osm_id",
-    "-dI",
-    envvar="DOCUMENT_OSM_ID",
-    help="Document physical object OSM identifier field",
-    default="id",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--document_capacity",
-    "-dC",
-    envvar="DOCUMENT_CAPACITY",
-    help="Document service capacity field",
-    default="-",
-    show_default=True,
-    show_envvar=True,
-)
+@_document_options
 @click.option(
     "--address_prefix",
     "-aP",
@@ -240,17 +135,19 @@ def insert_services(
     filename: str,
 ):  # pylint: disable=too-many-arguments,too-many-locals,
     """Insert services from geojson via command line"""
+    from platform_management.cli import insert_services_cli  # pylint: disable=import-outside-toplevel
+
     columns_mapping = ServiceInsertionMapping(
-        document_latitude,
-        document_longitude,
-        document_geometry,
-        document_service_name,
-        document_opening_hours,
-        document_website,
-        document_phone,
-        document_address,
-        document_osm_id,
-        document_capacity,
+        latitude=document_latitude,
+        longitude=document_longitude,
+        geometry=document_geometry,
+        name=document_service_name,
+        opening_hours=document_opening_hours,
+        website=document_website,
+        phone=document_phone,
+        address=document_address,
+        capacity=document_capacity,
+        osm_id=document_osm_id,
     )
     insert_services_cli(
         DatabaseCredentials(db_addr, db_port, db_name, db_user, db_pass),
@@ -1,6 +1,11 @@
 """
 Main group for subcommands registration.
 """
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Callable, TypeVar
+
 import click
 
 from platform_management.utils.dotenv import try_read_envfile
@@ -8,8 +13,129 @@ from platform_management.version import VERSION
 
 try_read_envfile()
 
+_F = TypeVar("_F", bound=Callable)
+
+_DB_OPTIONS = (
+    click.option(
+        "--db_addr",
+        "-H",
+        envvar="DB_ADDR",
+        help="Postgres DBMS address",
+        default="localhost",
+        show_default=True,
+        show_envvar=True,
+    ),
+    click.option(
+        "--db_port",
+        "-P",
+        envvar="DB_PORT",
+        type=int,
+        help="Postgres DBMS port",
+        default=5432,
+        show_default=True,
+        show_envvar=True,
+    ),
+    click.option(
+        "--db_name",
+        "-D",
+        envvar="DB_NAME",
+        help="Postgres city database name",
+        default="city_db_final",
+        show_default=True,
+        show_envvar=True,
+    ),
+    click.option(
+        "--db_user",
+        "-U",
+        envvar="DB_USER",
+        help="Postgres DBMS user name",
+        default="postgres",
+        show_default=True,
+        show_envvar=True,
+    ),
+    click.option(
+        "--db_pass",
+        "-W",
+        envvar="DB_PASS",
+        help="Postgres DBMS user password",
+        default="postgres",
+        show_default=True,
+        show_envvar=True,
+    ),
+)
+_INSERTION_OPTIONS = (
+    click.option(
+        "--dry_run",
+        "-d",
+        envvar="DRY_RUN",
+        is_flag=True,
+        help="Try to insert objects, but do not save results",
+        show_envvar=True,
+    ),
+    click.option(
+        "--verbose",
+        "-v",
+        envvar="VERBOSE",
+        is_flag=True,
+        help="Output stack trace when error happens",
+        show_envvar=True,
+    ),
+    click.option(
+        "--log_filename",
+        "-l",
+        envvar="LOGFILE",
+        help='path to create log file, empty or "-" to disable logging',
+        required=False,
+        show_default='current datetime "YYYY-MM-DD HH-mm-ss-<filename>.csv"',
+        show_envvar=True,
+    ),
+)
+
+
+def common_db_options(func: _F) -> _F:
+    """Add database connection options (--db_addr, --db_port, --db_name, --db_user, --db_pass) to the command."""
+    for option in reversed(_DB_OPTIONS):
+        func = option(func)
+    return func
+
+
+def insertion_options(func: _F) -> _F:
+    """Add common insertion commands options (--dry_run, --verbose, --log_filename) to the command."""
+    for option in reversed(_INSERTION_OPTIONS):
+        func = option(func)
+    return func
+
+
+class LazyGroup(click.Group):
+    """Commands group which imports subcommand module only when the subcommand is requested.
+
+    Subcommand modules are expected to register their commands in the group on import.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            import_module(self.lazy_subcommands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "gui": "platform_management.main.gui",
+        "insert-adms": "platform_management.main.insert_adms_cli",
+        "insert-blocks": "platform_management.main.insert_blocks_cli",
+        "insert-buildings": "platform_management.main.insert_buildings_cli",
+        "insert-services": "platform_management.main.insert_services_cli",
+        "operation": "platform_management.main.operations",
+    },
+)
 @click.version_option(VERSION)
 def main():
     """IDU - Platform Management Tool.
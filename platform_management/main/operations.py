@@ -1,83 +1,52 @@
-"""Blocks insertion command-line utility input information is defined here."""
+"""Database maintenance operations command-line utility is defined here."""
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, get_args
 
 import click
-import psycopg2
 
-from platform_management.cli import refresh_materialized_views, update_physical_objects_locations
-from platform_management.version import VERSION
+from platform_management.dto import DatabaseCredentials
 
-from .main_group import main
+from .main_group import common_db_options, main
+
+OperationName = Literal["update-physical-objects-locations", "update-buildings-area", "refresh-materialized-views"]
 
 
 @main.command()
-@click.option(
-    "--db_addr",
-    "-H",
-    envvar="DB_ADDR",
-    help="Postgres DBMS address",
-    default="localhost",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_port",
-    "-P",
-    envvar="DB_PORT",
-    type=int,
-    help="Postgres DBMS port",
-    default=5432,
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_name",
-    "-D",
-    envvar="DB_NAME",
-    help="Postgres city database name",
-    default="city_db_final",
-    show_default=True,
-    show_envvar=True,
-)
-@click.option(
-    "--db_user",
-    "-U",
-    envvar="DB_USER",
-    help="Postgres DBMS user name",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
+@common_db_options
+@click.argument(
+    "actions",
+    nargs=-1,
+    required=True,
+    type=click.Choice(get_args(OperationName), False),
 )
-@click.option(
-    "--db_pass",
-    "-W",
-    envvar="DB_PASS",
-    help="Postgres DBMS user password",
-    default="postgres",
-    show_default=True,
-    show_envvar=True,
-)
-@click.argument("action", type=click.Choice(["refresh-materialized-views", "update-physical-objects-locations"], False))
 def operation(
     db_addr: str,
     db_port: int,
     db_name: str,
     db_user: str,
     db_pass: str,
-    action: Literal["refresh-materialized-views", "update-physical-objects-locations"],
+    actions: tuple[OperationName, ...],
 ):  # pylint: disable=too-many-arguments,too-many-locals,
-    "Insert blocks from geojson via command line"
+    """Run database maintenance operations
+
+    Multiple actions are executed in the given order using a single connection and transaction.
+    """
+    import psycopg2  # pylint: disable=import-outside-toplevel
+
+    from platform_management.cli import (  # pylint: disable=import-outside-toplevel
+        refresh_materialized_views,
+        update_buildings_area,
+        update_physical_objects_locations,
+    )
+
+    operations = {
+        "update-physical-objects-locations": update_physical_objects_locations,
+        "update-buildings-area": update_buildings_area,
+        "refresh-materialized-views": refresh_materialized_views,
+    }
     with psycopg2.connect(
-        host=db_addr,
-        port=db_port,
-        dbname=db_name,
-        user=db_user,
-        password=db_pass,
-        application_name=f"platform_management_app v{VERSION}",
+        **DatabaseCredentials(db_addr, db_port, db_name, db_user, db_pass).get_connection_params()
     ) as conn, conn.cursor() as cur:
-        if action == "refresh-materialized-views":
-            refresh_materialized_views(cur)
-        else:
-            update_physical_objects_locations(cur)
+        for action in actions:
+            operations[action](cur)
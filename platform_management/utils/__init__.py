@@ -4,6 +4,10 @@ Utility functions used in platform_management module are located here.
 import string
 from typing import Any
 
+_NULL_STRINGS = frozenset(("", "nan", "none", "undefined"))
+_BOOL_STRINGS = {"true": True, "false": False}
+_DIGITS = frozenset(string.digits)
+
 
 def simplify_data(value: Any) -> Any:  # pylint: disable=too-many-return-statements
     """
@@ -19,24 +23,26 @@ def simplify_data(value: Any) -> Any:  # pylint: disable=too-many-return-stateme
     >>> simplify_data(numpy.nan)   # None
     >>> simplify_data(object())    # <object object at 0x...>
     """
-    if (
-        value is None
-        or (isinstance(value, float) and value != value)  # pylint: disable=comparison-with-itself
-        or (isinstance(value, str) and value.lower() in ("", "nan", "none", "undefined"))
-    ):
-        return None
-    if isinstance(value, int):
+    if value is None or isinstance(value, int):
         return value
     if isinstance(value, float):
+        if value != value:  # pylint: disable=comparison-with-itself
+            return None
         return int(value) if value.is_integer() else value
     if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _NULL_STRINGS:
+            return None
         if value.isnumeric():
             return int(value)
-        if value.count(".") == 1 and len(set(value) - {"."} - set(string.digits)) == 0:
+        integer_part, dot, fractional_part = value.partition(".")
+        if (
+            dot
+            and (integer_part or fractional_part)
+            and _DIGITS.issuperset(integer_part)
+            and _DIGITS.issuperset(fractional_part)
+        ):
             res = float(value)
-            if res.is_integer():
-                return int(res)
-        if value.lower() in ("false", "true"):
-            return len(value) == 4
-        return value
+            return int(res) if res.is_integer() else res
+        return _BOOL_STRINGS.get(lowered, value)
     return value
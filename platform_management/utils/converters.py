@@ -3,17 +3,26 @@ from __future__ import annotations
 
 from PySide6 import QtCore
 
+_CHECKSTATE_TO_BOOL: dict[QtCore.Qt.CheckState, bool | None] = {
+    QtCore.Qt.CheckState.PartiallyChecked: None,
+    QtCore.Qt.CheckState.Checked: True,
+    QtCore.Qt.CheckState.Unchecked: False,
+}
+_BOOL_TO_CHECKSTATE: dict[bool | None, QtCore.Qt.CheckState] = {
+    bool_value: state for state, bool_value in _CHECKSTATE_TO_BOOL.items()
+}
+
 
 def str_or_none(string: str) -> str | None:
     """Return the given string or None if it is empty."""
-    if len(string) == 0:
+    if not string:
         return None
     return string
 
 
 def int_or_none(string: str) -> int | None:
     """Return the given string as integer or None if it is empty."""
-    if len(string) == 0:
+    if not string:
         return None
     assert string.isnumeric(), f"{string} cannot be converted to integer"
     return int(string)
@@ -26,7 +35,7 @@ def to_str(i: int | float | str | None) -> str:  # pylint: disable=invalid-name
 
 def float_or_none(string: str) -> float | None:
     """Return the given string as float or None if it is empty."""
-    if len(string) == 0:
+    if not string:
         return None
     assert string.replace(".", "").isnumeric() and string.count(".") < 2, f"{string} cannot be convected to float"
     return float(string)
@@ -34,17 +43,9 @@ def float_or_none(string: str) -> float | None:
 
 def bool_or_none(state: QtCore.Qt.CheckState) -> bool | None:
     """Return True if state is cheched, False if not checked and None if partially checked (unknown)."""
-    if state == QtCore.Qt.CheckState.PartiallyChecked:
-        return None
-    if state == QtCore.Qt.CheckState.Checked:
-        return True
-    return False
+    return _CHECKSTATE_TO_BOOL.get(state, False)
 
 
 def bool_to_checkstate(bool_value: bool | None) -> QtCore.Qt.CheckState:
     """Return PartiallyChecked state for None, Checked for True and Unchecked for False."""
-    if bool_value is None:
-        return QtCore.Qt.CheckState.PartiallyChecked
-    if bool_value:
-        return QtCore.Qt.CheckState.Checked
-    return QtCore.Qt.CheckState.Unchecked
+    return _BOOL_TO_CHECKSTATE[None if bool_value is None else bool(bool_value)]
@@ -2,9 +2,19 @@
 from __future__ import annotations
 
 import os
+import re
 
 from loguru import logger
 
+_ENV_LINE_RE = re.compile(r"[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)[ \t]*=(.*?)(?:[ \t]+#.*)?$")
+"""Envfile variable definition: optional `export`, name, `=` and value up to the end of line or a comment."""
+
+
+def _parse_envfile(envfile: str) -> tuple[tuple[str, str], ...]:
+    """Get (name, value) pairs from the envfile. Raises OSError if the file cannot be read."""
+    with open(envfile, "r", encoding="utf-8") as file:
+        return tuple(match.groups() for match in map(_ENV_LINE_RE.match, file) if match is not None)
+
 
 def try_read_envfile(envfile_path: str | list[str] = ..., stop_after_first_success: bool = True) -> int:
     """Read variables and set them to os.env from the given file/list of files.
@@ -25,28 +35,17 @@ def try_read_envfile(envfile_path: str | list[str] = ..., stop_after_first_succe
         envfile_path = [envfile_path]
     files_read = 0
     for envfile in envfile_path:
-        if os.path.exists(envfile):
-            logger.info("Reading envfile file located at {}", envfile)
-            with open(envfile, "r", encoding="utf-8") as file:
-                for line in file:
-                    try:
-                        if len(line) == 0 or line.startswith("#"):
-                            continue
-                        if line.startswith("export "):
-                            line = line[len("export ") :].strip()
-                        name, value = line.split("=", 1)
-                        if " #" in value:
-                            value = value[: value.index(" #")].strip()
-                        if name in os.environ:
-                            logger.info(
-                                'Skipping env variable "{}" from envfile as it is already set',
-                                name,
-                            )
-                        else:
-                            os.environ[name] = value.strip()
-                    except RuntimeError:
-                        pass
-            files_read += 1
-            if stop_after_first_success:
-                return files_read
+        try:
+            variables = _parse_envfile(envfile)
+        except OSError:
+            continue
+        logger.info("Reading envfile file located at {}", envfile)
+        for name, value in variables:
+            if name in os.environ:
+                logger.info('Skipping env variable "{}" from envfile as it is already set', name)
+            else:
+                os.environ[name] = value.strip()
+        files_read += 1
+        if stop_after_first_success:
+            return files_read
     return files_read